@@ -4,21 +4,86 @@ Create a clean, structured Excel template for Cisco Intersight Server Profile Te
 This template follows Intersight's exact configuration structure and includes dropdowns.
 """
 
-import pandas as pd
 import os
+import concurrent.futures
+import hashlib
+import json
+import pathlib
+import shutil
+import tempfile
 import intersight
 from intersight.api_client import ApiClient
 from intersight.configuration import Configuration
 from intersight.api import bios_api, vnic_api, storage_api, organization_api, server_api
-from openpyxl import load_workbook
+from openpyxl import load_workbook, Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 
+# Header cell style, matching what pandas' to_excel applied before
+HEADER_FONT = Font(bold=True)
+HEADER_BORDER = Border(left=Side(style='thin'), right=Side(style='thin'),
+                       top=Side(style='thin'), bottom=Side(style='thin'))
+HEADER_ALIGNMENT = Alignment(horizontal='center', vertical='top')
+
+# Template sheets: (sheet name, column headers, [(row label, note), ...]); the
+# middle column of each row is prefilled from the matching template_config section
+POLICY_HEADERS = ('Policy Type', 'Policy Name', 'Description')
+TEMPLATE_SECTIONS = [
+    ('Basic Information', ('Parameter', 'Value', 'Notes'), [
+        ('Organization', 'Required. Select the organization for this template.'),
+        ('Name', 'Required. Enter a unique name for this template.'),
+        ('Description', 'Optional. Enter a description for this template.'),
+        ('Tags', 'Optional. Format: key1:value1,key2:value2'),
+    ]),
+    ('Compute Configuration', POLICY_HEADERS, [
+        ('BIOS Policy', 'Controls processor, memory, and other hardware settings'),
+        ('Boot Order Policy', 'Defines boot device sequence and options'),
+        ('Virtual Media Policy', 'Configures virtual media mapping (ISO, IMG files)'),
+        ('UUID Pool', 'For assigning unique identifiers to servers'),
+    ]),
+    ('Network Configuration', POLICY_HEADERS, [
+        ('LAN Connectivity Policy', 'Contains vNIC configurations, MAC address pools, VLANs, QoS settings'),
+        ('SAN Connectivity Policy', 'Contains vHBA configurations, WWPN/WWNN pools, VSANs, Fibre Channel settings'),
+        ('QoS Policy', 'Configures Quality of Service for network traffic'),
+    ]),
+    ('Storage Configuration', POLICY_HEADERS, [
+        ('SD Card Policy', 'Configures SD card settings'),
+        ('Storage Policy', 'Defines RAID configurations, disk groups, virtual drives'),
+        ('Persistent Memory Policy', 'For Intel Optane DC persistent memory'),
+    ]),
+    ('Power & Thermal', POLICY_HEADERS, [
+        ('Power Policy', 'Controls power characteristics'),
+        ('Thermal Policy', 'Manages cooling and fan behavior'),
+    ]),
+]
+
+# Shared Intersight API client, created on first use by get_api_client()
+_API_CLIENT = None
+
+# Organization and policy MOIDs by (api client id, ...); only found MOIDs are kept
+_MOID_CACHE = {}
+
+# Previously generated templates, keyed by a hash of everything that goes into the file
+TEMPLATE_CACHE_DIR = pathlib.Path('~/.cache/intersight_master_node/templates').expanduser()
+
+# Maximum number of concurrent Intersight list calls
+MAX_API_WORKERS = 4
+
+# Page size for iter_names(); Intersight caps $top at 1000
+LIST_PAGE_SIZE = 1000
+
 def get_api_client():
     """
-    Create an Intersight API client using the API key file
+    Create an Intersight API client using the API key file.
+    
+    The client is created once per process and shared by every caller.
     """
+    global _API_CLIENT
+    if _API_CLIENT is not None:
+        return _API_CLIENT
+    
     try:
         # Get API key details from environment variables
         api_key_id = os.getenv('INTERSIGHT_API_KEY_ID')
@@ -46,14 +111,29 @@ def get_api_client():
             )
         )
         
+        # One pooled connection per concurrent list call, so parallel requests
+        # reuse their TLS sessions instead of opening and discarding new ones
+        config.connection_pool_maxsize = MAX_API_WORKERS
+        
         # Create API client
-        api_client = ApiClient(configuration=config)
-        return api_client
+        _API_CLIENT = ApiClient(configuration=config)
+        return _API_CLIENT
         
     except Exception as e:
         print(f"Error creating API client: {str(e)}")
         return None
 
+def iter_names(list_call, page_size=LIST_PAGE_SIZE):
+    """Yield the Name of every object a get_*_list call returns, one page at a time"""
+    skip = 0
+    while True:
+        results = list_call(select="Name", top=page_size, skip=skip).results
+        for result in results:
+            yield result.name
+        if len(results) < page_size:
+            return
+        skip += page_size
+
 def get_organizations(api_client):
     """
     Get list of organizations from Intersight
@@ -63,8 +143,8 @@ def get_organizations(api_client):
         
     try:
         org_api = organization_api.OrganizationApi(api_client)
-        orgs = org_api.get_organization_organization_list()
-        return [org.name for org in orgs.results] if orgs.results else ["default"]
+        org_names = list(iter_names(org_api.get_organization_organization_list))
+        return org_names if org_names else ["default"]
     except Exception as e:
         print(f"Error fetching organizations: {str(e)}")
         return ["default"]
@@ -74,171 +154,112 @@ def get_available_policies(api_client):
     Get lists of available policies from Intersight
     """
     try:
-        # Get BIOS Policies
-        bios_api_instance = bios_api.BiosApi(api_client)
-        bios_policies = bios_api_instance.get_bios_policy_list().results
-        bios_policy_names = [policy.name for policy in bios_policies]
-
-        # Get QoS Policies
-        qos_api_instance = vnic_api.VnicApi(api_client)
-        qos_policies = qos_api_instance.get_vnic_eth_qos_policy_list().results
-        qos_policy_names = [policy.name for policy in qos_policies]
-
-        # Get Storage Policies
-        storage_api_instance = storage_api.StorageApi(api_client)
-        storage_policies = storage_api_instance.get_storage_storage_policy_list().results
-        storage_policy_names = [policy.name for policy in storage_policies]
-
-        # Get LAN Connectivity Policies
-        lan_api_instance = vnic_api.VnicApi(api_client)
-        lan_policies = lan_api_instance.get_vnic_lan_connectivity_policy_list().results
-        lan_policy_names = [policy.name for policy in lan_policies]
+        vnic_api_instance = vnic_api.VnicApi(api_client)
+        list_calls = {
+            'bios_policies': bios_api.BiosApi(api_client).get_bios_policy_list,
+            'qos_policies': vnic_api_instance.get_vnic_eth_qos_policy_list,
+            'storage_policies': storage_api.StorageApi(api_client).get_storage_storage_policy_list,
+            'lan_policies': vnic_api_instance.get_vnic_lan_connectivity_policy_list,
+        }
+
+        # The four lists are independent, so fetch them concurrently and only
+        # transfer the names, page by page
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+            futures = {key: executor.submit(lambda call: list(iter_names(call)), list_call)
+                       for key, list_call in list_calls.items()}
+            policy_names = {key: future.result() for key, future in futures.items()}
 
         print("\nAvailable Policies in Intersight:")
-        print("BIOS Policies:", bios_policy_names)
-        print("QoS Policies:", qos_policy_names)
-        print("Storage Policies:", storage_policy_names)
-        print("LAN Connectivity Policies:", lan_policy_names)
-
-        return {
-            'bios_policies': bios_policy_names,
-            'qos_policies': qos_policy_names,
-            'storage_policies': storage_policy_names,
-            'lan_policies': lan_policy_names
-        }
+        print("BIOS Policies:", policy_names['bios_policies'])
+        print("QoS Policies:", policy_names['qos_policies'])
+        print("Storage Policies:", policy_names['storage_policies'])
+        print("LAN Connectivity Policies:", policy_names['lan_policies'])
+
+        return policy_names
 
     except Exception as e:
         print(f"Error getting policies: {str(e)}")
         return None
 
-def create_excel_template(output_file, policies, template_config=None):
-    """Create an Excel template with policy dropdowns"""
+def write_sheet(workbook, title, headers, rows):
+    """Stream a header row and then the data rows to a new write-only sheet"""
+    sheet = workbook.create_sheet(title)
+    
+    header_cells = []
+    for header in headers:
+        cell = WriteOnlyCell(sheet, value=header)
+        cell.font = HEADER_FONT
+        cell.border = HEADER_BORDER
+        cell.alignment = HEADER_ALIGNMENT
+        header_cells.append(cell)
+    sheet.append(header_cells)
+    
+    for row in rows:
+        sheet.append(row)
+    return sheet
+
+def template_cache_file(template_config):
+    """Return the cache path for a template built from template_config by this version of the script"""
+    key_data = json.dumps({
+        'template_config': template_config,
+        'sections': TEMPLATE_SECTIONS,
+        'script_mtime': os.path.getmtime(__file__),
+    }, sort_keys=True, default=str)
+    key = hashlib.blake2b(key_data.encode('utf-8'), digest_size=16).hexdigest()
+    return TEMPLATE_CACHE_DIR / f"{key}.xlsx"
+
+def create_excel_template(output_file, policies, template_config=None, api_client=None, organizations=None):
+    """
+    Create an Excel template with policy dropdowns
+    
+    Pass the caller's api_client and any organizations already fetched to avoid
+    querying Intersight again; missing values are looked up here.
+    """
     try:
         # Create output directory if it doesn't exist
         os.makedirs(os.path.dirname(output_file), exist_ok=True)
 
-        # Create a Pandas Excel writer using openpyxl as the engine
-        writer = pd.ExcelWriter(output_file, engine='openpyxl')
-
-        # Get organizations from Intersight
-        api_client = get_api_client()
-        organizations = get_organizations(api_client)
-        organizations_str = ','.join(organizations) if organizations else "default"
-
-        # Basic Information Sheet
-        basic_info_data = {
-            'Parameter': [
-                'Organization', 
-                'Name', 
-                'Description', 
-                'Tags'
-            ],
-            'Value': [
-                template_config.get('Basic Information', {}).get('Organization', '') if template_config else '',
-                template_config.get('Basic Information', {}).get('Name', '') if template_config else '',
-                template_config.get('Basic Information', {}).get('Description', '') if template_config else '',
-                template_config.get('Basic Information', {}).get('Tags', '') if template_config else ''
-            ],
-            'Notes': [
-                'Required. Select the organization for this template.', 
-                'Required. Enter a unique name for this template.', 
-                'Optional. Enter a description for this template.', 
-                'Optional. Format: key1:value1,key2:value2'
-            ]
-        }
-
-        # Compute Configuration Sheet
-        compute_data = {
-            'Policy Type': [
-                'BIOS Policy', 
-                'Boot Order Policy', 
-                'Virtual Media Policy',
-                'UUID Pool'
-            ],
-            'Policy Name': [
-                template_config.get('Compute Configuration', {}).get('BIOS Policy', '') if template_config else '',
-                template_config.get('Compute Configuration', {}).get('Boot Order Policy', '') if template_config else '',
-                template_config.get('Compute Configuration', {}).get('Virtual Media Policy', '') if template_config else '',
-                template_config.get('Compute Configuration', {}).get('UUID Pool', '') if template_config else ''
-            ],
-            'Description': [
-                'Controls processor, memory, and other hardware settings', 
-                'Defines boot device sequence and options', 
-                'Configures virtual media mapping (ISO, IMG files)',
-                'For assigning unique identifiers to servers'
-            ]
-        }
-
-        # Network Configuration Sheet
-        network_data = {
-            'Policy Type': [
-                'LAN Connectivity Policy', 
-                'SAN Connectivity Policy',
-                'QoS Policy'
-            ],
-            'Policy Name': [
-                template_config.get('Network Configuration', {}).get('LAN Connectivity Policy', '') if template_config else '',
-                template_config.get('Network Configuration', {}).get('SAN Connectivity Policy', '') if template_config else '',
-                template_config.get('Network Configuration', {}).get('QoS Policy', '') if template_config else ''
-            ],
-            'Description': [
-                'Contains vNIC configurations, MAC address pools, VLANs, QoS settings', 
-                'Contains vHBA configurations, WWPN/WWNN pools, VSANs, Fibre Channel settings',
-                'Configures Quality of Service for network traffic'
-            ]
-        }
+        # The file only depends on template_config, so reuse an identical earlier build
+        cache_file = template_cache_file(template_config)
+        if cache_file.exists():
+            shutil.copyfile(cache_file, output_file)
+            print(f"Excel template with dropdowns created successfully: {output_file} (cached)")
+            return True
 
-        # Storage Configuration Sheet
-        storage_data = {
-            'Policy Type': [
-                'SD Card Policy', 
-                'Storage Policy', 
-                'Persistent Memory Policy'
-            ],
-            'Policy Name': [
-                template_config.get('Storage Configuration', {}).get('SD Card Policy', '') if template_config else '',
-                template_config.get('Storage Configuration', {}).get('Storage Policy', '') if template_config else '',
-                template_config.get('Storage Configuration', {}).get('Persistent Memory Policy', '') if template_config else ''
-            ],
-            'Description': [
-                'Configures SD card settings', 
-                'Defines RAID configurations, disk groups, virtual drives', 
-                'For Intel Optane DC persistent memory'
-            ]
-        }
+        # Stream the sheets straight out instead of building them through pandas
+        workbook = Workbook(write_only=True)
 
-        # Power & Thermal Sheet
-        power_thermal_data = {
-            'Policy Type': [
-                'Power Policy', 
-                'Thermal Policy'
-            ],
-            'Policy Name': [
-                template_config.get('Power & Thermal', {}).get('Power Policy', '') if template_config else '',
-                template_config.get('Power & Thermal', {}).get('Thermal Policy', '') if template_config else ''
-            ],
-            'Description': [
-                'Controls power characteristics', 
-                'Manages cooling and fan behavior'
-            ]
-        }
+        # Get organizations from Intersight unless the caller already has them
+        if organizations is None:
+            organizations = get_organizations(api_client or get_api_client())
+        organizations_str = ','.join(organizations) if organizations else "default"
 
-        # Create DataFrames
-        basic_info_df = pd.DataFrame(basic_info_data)
-        compute_df = pd.DataFrame(compute_data)
-        network_df = pd.DataFrame(network_data)
-        storage_df = pd.DataFrame(storage_data)
-        power_thermal_df = pd.DataFrame(power_thermal_data)
+        # Write one sheet per section, prefilled from any existing configuration
+        sections = template_config or {}
+        for sheet_name, headers, rows in TEMPLATE_SECTIONS:
+            section_config = sections.get(sheet_name, {})
+            write_sheet(workbook, sheet_name, headers,
+                        [(label, section_config.get(label, ''), note) for label, note in rows])
 
-        # Write DataFrames to Excel
-        basic_info_df.to_excel(writer, sheet_name='Basic Information', index=False)
-        compute_df.to_excel(writer, sheet_name='Compute Configuration', index=False)
-        network_df.to_excel(writer, sheet_name='Network Configuration', index=False)
-        storage_df.to_excel(writer, sheet_name='Storage Configuration', index=False)
-        power_thermal_df.to_excel(writer, sheet_name='Power & Thermal', index=False)
+        # Save the workbook
+        workbook.save(output_file)
 
-        # Save the writer
-        writer.close()
+        # Keep a copy for the next run; a failed cache write is not an error
+        # A unique temp file keeps concurrent runs from clobbering each other's copy
+        temp_file = None
+        try:
+            TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=TEMPLATE_CACHE_DIR, suffix='.tmp', delete=False) as f:
+                temp_file = f.name
+            shutil.copyfile(output_file, temp_file)
+            os.replace(temp_file, cache_file)
+        except OSError as e:
+            print(f"Could not cache Excel template: {str(e)}")
+            if temp_file is not None:
+                try:
+                    os.remove(temp_file)
+                except OSError:
+                    pass
 
         print(f"Excel template with dropdowns created successfully: {output_file}")
         return True
@@ -249,10 +270,15 @@ def create_excel_template(output_file, policies, template_config=None):
 
 def get_org_moid(api_client):
     """Get the MOID of the organization"""
+    key = (id(api_client), 'organization.Organization')
+    if key in _MOID_CACHE:
+        return _MOID_CACHE[key]
+    
     try:
         org_api = organization_api.OrganizationApi(api_client)
-        orgs = org_api.get_organization_organization_list()
-        return orgs.results[0].moid
+        orgs = org_api.get_organization_organization_list(select="Moid")
+        _MOID_CACHE[key] = orgs.results[0].moid
+        return _MOID_CACHE[key]
     except Exception as e:
         print(f"Error getting organization MOID: {str(e)}")
         return None
@@ -262,18 +288,23 @@ def get_policy_moid(api_client, policy_type, policy_name):
     try:
         if not policy_name:
             return None
+        
+        key = (id(api_client), policy_type, policy_name)
+        if key in _MOID_CACHE:
+            return _MOID_CACHE[key]
             
         if policy_type == 'bios.Policy':
             api_instance = bios_api.BiosApi(api_client)
-            response = api_instance.get_bios_policy_list(filter=f"Name eq '{policy_name}'")
+            response = api_instance.get_bios_policy_list(filter=f"Name eq '{policy_name}'", select="Moid")
         elif policy_type == 'vnic.LanConnectivityPolicy':
             api_instance = vnic_api.VnicApi(api_client)
-            response = api_instance.get_vnic_lan_connectivity_policy_list(filter=f"Name eq '{policy_name}'")
+            response = api_instance.get_vnic_lan_connectivity_policy_list(filter=f"Name eq '{policy_name}'", select="Moid")
         else:
             return None
         
         if response.results:
-            return response.results[0].moid
+            _MOID_CACHE[key] = response.results[0].moid
+            return _MOID_CACHE[key]
         return None
         
     except Exception as e:
@@ -339,22 +370,32 @@ def push_template_to_intersight(api_client, template_file):
         print(f"\nReading template configuration from {template_file}...")
         template_data = {}
         
-        # Read each sheet into a dictionary
-        xls = pd.ExcelFile(template_file)
-        for sheet_name in xls.sheet_names:
-            if sheet_name not in ['Instructions', 'ReferenceData']:
-                df = pd.read_excel(template_file, sheet_name=sheet_name)
-                # Convert DataFrame to dictionary
+        # Stream cell values in read-only mode and read every sheet into a dictionary
+        workbook = load_workbook(template_file, read_only=True, data_only=True)
+        try:
+            for sheet in workbook.worksheets:
+                if sheet.title in ['Instructions', 'ReferenceData']:
+                    continue
+                rows = sheet.iter_rows(values_only=True)
+                header = list(next(rows, ()))
+                
+                # Map the sheet's key column to its value column
                 sheet_data = {}
-                if 'Parameter' in df.columns and 'Value' in df.columns:
-                    for _, row in df.iterrows():
-                        if pd.notna(row['Parameter']) and pd.notna(row['Value']):
-                            sheet_data[row['Parameter']] = row['Value']
-                elif 'Policy Type' in df.columns and 'Policy Name' in df.columns:
-                    for _, row in df.iterrows():
-                        if pd.notna(row['Policy Type']) and pd.notna(row['Policy Name']):
-                            sheet_data[row['Policy Type']] = row['Policy Name']
-                template_data[sheet_name] = sheet_data
+                if 'Parameter' in header and 'Value' in header:
+                    key_index, value_index = header.index('Parameter'), header.index('Value')
+                elif 'Policy Type' in header and 'Policy Name' in header:
+                    key_index, value_index = header.index('Policy Type'), header.index('Policy Name')
+                else:
+                    key_index = value_index = None
+                if key_index is not None:
+                    for row in rows:
+                        key = row[key_index] if key_index < len(row) else None
+                        value = row[value_index] if value_index < len(row) else None
+                        if key not in (None, '') and value not in (None, ''):
+                            sheet_data[key] = value
+                template_data[sheet.title] = sheet_data
+        finally:
+            workbook.close()
         
         # Create the server template in Intersight
         if not template_data.get('Basic Information', {}).get('Name'):
@@ -382,7 +423,7 @@ if __name__ == "__main__":
         exit(1)
 
     # Create the template
-    create_excel_template('output/Intersight_Server_Profile_Template.xlsx', policies)
+    create_excel_template('output/Intersight_Server_Profile_Template.xlsx', policies, api_client=api_client)
     print("\nExcel template with dropdowns created successfully: output/Intersight_Server_Profile_Template.xlsx")
 
     # Push the template to Intersight
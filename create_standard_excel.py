@@ -10,48 +10,90 @@ import openpyxl
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.worksheet.datavalidation import DataValidation
+from openpyxl.cell import WriteOnlyCell
+
+# Shared cell styles; openpyxl styles are immutable so one instance serves every cell
+HEADER_FILL = PatternFill(start_color='FFA0D7BE', end_color='FFA0D7BE', fill_type='solid')
+HEADER_FONT = Font(bold=True)
+WRAP_CENTER = Alignment(wrap_text=True, vertical='center')
+
+# Sample data - generic until update script runs
+ORGS = ["default", "Organization-2", "Organization-3", "Organization-4"]
+RESOURCE_GROUPS = ["default", "Resource-Group-2", "Resource-Group-3", "Resource-Group-4"]
+SERVER_OPTIONS = [
+    "XXXXX | Example Server 1", 
+    "YYYYY | Example Server 2",
+    "ZZZZZ | Example Server 3",
+    "AAAAA | Example Worker 1"
+]
+POOL_TYPES = ["MAC Pool", "UUID Pool"]
+POLICY_TYPES = [
+    "BIOS Policy",
+    "Boot Order Policy",
+    "vNIC / LAN Connectivity Policy",
+    "vHBA / SAN Connectivity Policy", 
+    "Local Disk Policy",
+    "Storage Policy",
+    "IMC Access Policy",
+    "Power and Thermal Policy",
+    "GPU Policy",
+    "vMedia Policy",
+    "IPMI Policy",
+    "KVM Policy",
+    "Serial-over-LAN Policy",
+    "QoS Policy"
+]
+PLATFORMS = ["FIAttached", "Standalone"]
+
+# Dropdown list formulas, joined once at import time and shared by every sheet
+ORGS_F1 = '"' + ",".join(ORGS) + '"'
+RG_F1 = '"' + ",".join(RESOURCE_GROUPS) + '"'
+# Only include the first few servers to prevent Excel validation issues
+SERVERS_F1 = '"' + ",".join(SERVER_OPTIONS[:10]) + '"'
+POOL_TYPES_F1 = '"' + ",".join(POOL_TYPES) + '"'
+POLICY_TYPES_F1 = '"' + ",".join(POLICY_TYPES) + '"'
+PLATFORM_F1 = '"' + ",".join(PLATFORMS) + '"'
+YES_NO_F1 = '"Yes,No"'
+
+
+def append_row(sheet, values, alignment, font=None, fill=None):
+    """Append one row of styled cells to a write-only sheet"""
+    row = []
+    for value in values:
+        cell = WriteOnlyCell(sheet, value=value)
+        cell.alignment = alignment
+        if font is not None:
+            cell.font = font
+        if fill is not None:
+            cell.fill = fill
+        row.append(cell)
+    sheet.append(row)
+
+def write_header(sheet, headers):
+    """Append the styled header row to a write-only sheet"""
+    append_row(sheet, headers, WRAP_CENTER, font=HEADER_FONT, fill=HEADER_FILL)
 
 def create_standard_excel(excel_file):
     """Create a simple Excel template with standard dropdowns"""
     try:
-        # Create workbook
-        wb = openpyxl.Workbook()
-        
-        # Remove default sheet
-        default_sheet = wb.active
-        wb.remove(default_sheet)
+        # Create a write-only workbook; rows are streamed straight to XML
+        wb = openpyxl.Workbook(write_only=True)
         
         # Create sheets in correct order
+        sheets = {}
         for sheet_name in ['Pools', 'Policies', 'Template', 'Profiles', 'Templates', 'Organizations', 'Servers']:
-            wb.create_sheet(sheet_name)
-        
-        # Define header style
-        header_fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')
-        header_font = Font(bold=True)
-        
-        # Sample data - generic until update script runs
-        orgs = ["default", "Organization-2", "Organization-3", "Organization-4"]
-        resource_groups = ["default", "Resource-Group-2", "Resource-Group-3", "Resource-Group-4"]
-        server_options = [
-            "XXXXX | Example Server 1", 
-            "YYYYY | Example Server 2",
-            "ZZZZZ | Example Server 3",
-            "AAAAA | Example Worker 1"
-        ]
+            sheets[sheet_name] = wb.create_sheet(sheet_name)
+            # Freeze the header row in each sheet
+            sheets[sheet_name].freeze_panes = 'A2'
         
         # Create the Profiles sheet
-        profiles = wb["Profiles"]
+        profiles = sheets["Profiles"]
         
         # Add headers
         headers = ["Profile Name*", "Description", "Organization*", "Resource Group*", 
                    "Template Name*", "Server*", "Notes", "Deploy*"]
         
-        for col, header in enumerate(headers, 1):
-            cell = profiles.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
-            
-        # Set column widths
+        # Set column widths (before the first row is streamed)
         profiles.column_dimensions['A'].width = 25  # Profile Name
         profiles.column_dimensions['B'].width = 20  # Description
         profiles.column_dimensions['C'].width = 15  # Organization
@@ -61,6 +103,8 @@ def create_standard_excel(excel_file):
         profiles.column_dimensions['G'].width = 30  # Notes
         profiles.column_dimensions['H'].width = 10  # Deploy
         
+        write_header(profiles, headers)
+        
         # Create sample data rows
         sample_rows = [
             ["AI-Server-01", "", "default", "AI POD Servers", "AI_POD_Template", "", "Production AI POD Host 1", "No"],
@@ -69,54 +113,47 @@ def create_standard_excel(excel_file):
             ["AI-Server-04", "", "default", "Production", "AI_POD_Template", "", "Production AI POD Host 4", "No"]
         ]
         
-        for row_idx, row_data in enumerate(sample_rows, 2):
-            for col_idx, value in enumerate(row_data, 1):
-                profiles.cell(row=row_idx, column=col_idx, value=value)
+        for row_data in sample_rows:
+            append_row(profiles, row_data, WRAP_CENTER)
         
         # Create simple dropdowns (no dynamic formulas, just plain lists)
         # Organization dropdown - use more compatible format with comma instead of semicolon
-        org_validation = DataValidation(type='list', formula1=f'"{",".join(orgs)}"', allow_blank=True)
+        org_validation = DataValidation(type='list', formula1=ORGS_F1, allow_blank=True)
         org_validation.add('C2:C1000')
-        profiles.add_data_validation(org_validation)
+        profiles.data_validations.append(org_validation)
         
         # Resource Group dropdown
-        rg_validation = DataValidation(type='list', formula1=f'"{",".join(resource_groups)}"', allow_blank=True)
+        rg_validation = DataValidation(type='list', formula1=RG_F1, allow_blank=True)
         rg_validation.add('D2:D1000')
-        profiles.add_data_validation(rg_validation)
+        profiles.data_validations.append(rg_validation)
         
-        # Server dropdown - limit the size for better compatibility
-        # Only include first few servers to prevent Excel validation issues
-        visible_servers = server_options[:10] if len(server_options) > 10 else server_options
-        server_validation = DataValidation(type='list', formula1=f'"{",".join(visible_servers)}"', allow_blank=True)
+        # Server dropdown - limited to the first few servers for better compatibility
+        server_validation = DataValidation(type='list', formula1=SERVERS_F1, allow_blank=True)
         server_validation.add('F2:F1000')
-        profiles.add_data_validation(server_validation)
+        profiles.data_validations.append(server_validation)
         
         # Deploy dropdown - simpler validation
-        deploy_validation = DataValidation(type='list', formula1='"Yes,No"', allow_blank=True)
+        deploy_validation = DataValidation(type='list', formula1=YES_NO_F1, allow_blank=True)
         deploy_validation.add('H2:H1000')
-        profiles.add_data_validation(deploy_validation)
+        profiles.data_validations.append(deploy_validation)
         
         # Pools sheet
-        pools = wb["Pools"]
-        pool_headers = ["Pool Type*", "Pool Name*", "Description", "First ID", "Size"]
+        pools = sheets["Pools"]
+        pool_headers = ["Pool Type*", "Pool Name*", "Description", "First Address*", "Size*"]
         
         # Set column widths for Pools sheet
         pools.column_dimensions['A'].width = 20  # Pool Type
         pools.column_dimensions['B'].width = 30  # Pool Name
         pools.column_dimensions['C'].width = 40  # Description
-        pools.column_dimensions['D'].width = 20  # First ID
+        pools.column_dimensions['D'].width = 20  # First Address
         pools.column_dimensions['E'].width = 15  # Size
         
-        for col, header in enumerate(pool_headers, 1):
-            cell = pools.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
+        write_header(pools, pool_headers)
             
         # Pools dropdown
-        pool_types = ["MAC Pool", "UUID Pool"]
-        pools_validation = DataValidation(type='list', formula1=f'"{",".join(pool_types)}"', allow_blank=True)
+        pools_validation = DataValidation(type='list', formula1=POOL_TYPES_F1, allow_blank=True)
         pools_validation.add('A2:A1000')
-        pools.add_data_validation(pools_validation)
+        pools.data_validations.append(pools_validation)
         
         # Sample pools data with valid addresses for immediate push capability
         sample_pools = [
@@ -125,16 +162,11 @@ def create_standard_excel(excel_file):
             ("UUID Pool", "AI_POD-UUID-Pool", "UUID Pool for AI POD Servers", "0000-000000000001", "100")
         ]
         
-        # Add explanatory headers to make editing more intuitive
-        for col, header in enumerate(["Pool Type*", "Pool Name*", "Description", "First Address*", "Size*"], 1):
-            pools.cell(row=1, column=col).value = header
-        
-        for row_idx, row_data in enumerate(sample_pools, 2):
-            for col_idx, value in enumerate(row_data, 1):
-                pools.cell(row=row_idx, column=col_idx, value=value)
+        for row_data in sample_pools:
+            append_row(pools, row_data, WRAP_CENTER)
         
         # Policies sheet
-        policies = wb["Policies"]
+        policies = sheets["Policies"]
         policies_headers = ["Policy Type*", "Policy Name*", "Description", "Organization*"]
         
         # Set column widths for Policies sheet
@@ -143,36 +175,17 @@ def create_standard_excel(excel_file):
         policies.column_dimensions['C'].width = 40  # Description
         policies.column_dimensions['D'].width = 20  # Organization
         
-        for col, header in enumerate(policies_headers, 1):
-            cell = policies.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
+        write_header(policies, policies_headers)
             
         # Policy type dropdown
-        policy_types = [
-            "BIOS Policy",
-            "Boot Order Policy",
-            "vNIC / LAN Connectivity Policy",
-            "vHBA / SAN Connectivity Policy", 
-            "Local Disk Policy",
-            "Storage Policy",
-            "IMC Access Policy",
-            "Power and Thermal Policy",
-            "GPU Policy",
-            "vMedia Policy",
-            "IPMI Policy",
-            "KVM Policy",
-            "Serial-over-LAN Policy",
-            "QoS Policy"
-        ]
-        policy_validation = DataValidation(type='list', formula1=f'"{",".join(policy_types)}"', allow_blank=True)
+        policy_validation = DataValidation(type='list', formula1=POLICY_TYPES_F1, allow_blank=True)
         policy_validation.add('A2:A1000')
-        policies.add_data_validation(policy_validation)
+        policies.data_validations.append(policy_validation)
         
         # Organization dropdown for policies
-        org_validation_policies = DataValidation(type='list', formula1=f'"{",".join(orgs)}"', allow_blank=True)
+        org_validation_policies = DataValidation(type='list', formula1=ORGS_F1, allow_blank=True)
         org_validation_policies.add('D2:D1000')
-        policies.add_data_validation(org_validation_policies)
+        policies.data_validations.append(org_validation_policies)
         
         # Sample policies with updated policy types
         sample_policies = [
@@ -190,12 +203,11 @@ def create_standard_excel(excel_file):
             ("QoS Policy", "AI_POD-QoS", "Network QoS optimization for AI traffic", "default")
         ]
         
-        for row_idx, row_data in enumerate(sample_policies, 2):
-            for col_idx, value in enumerate(row_data, 1):
-                policies.cell(row=row_idx, column=col_idx, value=value)
+        for row_data in sample_policies:
+            append_row(policies, row_data, WRAP_CENTER)
         
         # Template sheet
-        template = wb["Template"]
+        template = sheets["Template"]
         template_headers = ["Template Name*", "Organization*", "Resource Group*", 
                            "Description", "Target Platform*"]
         
@@ -206,66 +218,45 @@ def create_standard_excel(excel_file):
         template.column_dimensions['D'].width = 40  # Description
         template.column_dimensions['E'].width = 20  # Target Platform
         
-        for col, header in enumerate(template_headers, 1):
-            cell = template.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
+        write_header(template, template_headers)
             
         # Template sample data
         template_data = ["Ai_POD_Template", "default", "AI POD Servers", 
                          "Template for AI POD Servers", "FIAttached"]
         
-        for col, value in enumerate(template_data, 1):
-            template.cell(row=2, column=col, value=value)
+        append_row(template, template_data, WRAP_CENTER)
             
         # Template dropdowns
         # Organization for template
-        org_validation_template = DataValidation(type='list', formula1=f'"{",".join(orgs)}"', allow_blank=True)
+        org_validation_template = DataValidation(type='list', formula1=ORGS_F1, allow_blank=True)
         org_validation_template.add('B2:B1000')
-        template.add_data_validation(org_validation_template)
+        template.data_validations.append(org_validation_template)
         
         # Resource Group for template
-        rg_validation_template = DataValidation(type='list', formula1=f'"{",".join(resource_groups)}"', allow_blank=True)
+        rg_validation_template = DataValidation(type='list', formula1=RG_F1, allow_blank=True)
         rg_validation_template.add('C2:C1000')
-        template.add_data_validation(rg_validation_template)
+        template.data_validations.append(rg_validation_template)
         
         # Target Platform dropdown
-        platforms = ["FIAttached", "Standalone"]
-        platform_validation = DataValidation(type='list', formula1=f'"{",".join(platforms)}"', allow_blank=True)
+        platform_validation = DataValidation(type='list', formula1=PLATFORM_F1, allow_blank=True)
         platform_validation.add('E2:E1000')
-        template.add_data_validation(platform_validation)
+        template.data_validations.append(platform_validation)
         
         # Servers sheet
-        servers = wb["Servers"]
+        servers = sheets["Servers"]
         servers_headers = ["Server Name", "Serial Number"]
         
         # Set column widths for Servers sheet
         servers.column_dimensions['A'].width = 40  # Server Name
         servers.column_dimensions['B'].width = 25  # Serial Number
         
-        for col, header in enumerate(servers_headers, 1):
-            cell = servers.cell(row=1, column=col, value=header)
-            cell.fill = header_fill
-            cell.font = header_font
+        write_header(servers, servers_headers)
             
         # Add sample server data
-        for idx, server_info in enumerate(server_options, 2):
-            parts = server_info.split(" | ")
-            if len(parts) == 2:
-                serial, name = parts
-                servers.cell(row=idx, column=1, value=name)
-                servers.cell(row=idx, column=2, value=serial)
-        
-        # Apply consistent styling to all worksheets
-        for sheet_name in wb.sheetnames:
-            sheet = wb[sheet_name]
-            # Apply text wrapping and alignment to all cells
-            for row in sheet.iter_rows(min_row=1, max_row=sheet.max_row):
-                for cell in row:
-                    cell.alignment = Alignment(wrap_text=True, vertical='center')
-            
-            # Freeze the header row in each sheet
-            sheet.freeze_panes = 'A2'
+        for server_info in SERVER_OPTIONS:
+            serial, sep, name = server_info.partition(" | ")
+            if sep:
+                append_row(servers, [name, serial], WRAP_CENTER)
         
         # Save the workbook
         wb.save(excel_file)
@@ -14,6 +14,7 @@ import requests
 import time
 import base64
 import math
+import random
 import hashlib
 import hmac
 import urllib.parse
@@ -24,16 +25,25 @@ from tqdm import tqdm
 from colorama import Fore, Style, init
 from intersight.api_client import ApiClient
 from intersight.configuration import Configuration
+from intersight.exceptions import ApiException
 from intersight.rest import RESTResponse
+from intersight.model_utils import validate_and_convert_types
 from openpyxl import load_workbook, Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 from openpyxl.worksheet.datavalidation import DataValidation
 from openpyxl.comments import Comment
+from openpyxl.cell import WriteOnlyCell
 import uuid
-from datetime import datetime
+from datetime import datetime, date
 import functools
 import concurrent.futures
+import contextlib
+import threading
+from operator import itemgetter
+import pathlib
+import tempfile
+import io
 from typing import Dict, List, Any, Tuple, Optional
 
 # Initialize colorama for colored terminal output
@@ -59,6 +69,13 @@ logger = logging.getLogger(__name__)
 MAX_RETRIES = 3
 # Delay between retries in seconds
 RETRY_DELAY = 2
+# HTTP statuses worth retrying: throttling and gateway/availability errors
+RETRYABLE_STATUS_CODES = {429, 502, 503, 504}
+# Maximum number of concurrent Intersight requests issued for one batch
+MAX_API_WORKERS = 8
+# Create requests allowed in flight at once, and started per second; see create_rate_limit()
+MAX_CONCURRENT_CREATES = 5
+CREATE_RATE_PER_SECOND = 5
 from intersight.api import (
     bios_api,
     boot_api,
@@ -84,9 +101,70 @@ load_dotenv()
 # Cache for API results
 API_CACHE = {}
 
+# Shared Intersight API client, created on first use by get_api_client()
+_API_CLIENT = None
+
+# Organization MOIDs by (api client id, organization name); see clear_moid_caches()
+_ORG_MOID_CACHE = {}
+
+# Policy and pool MOIDs by (api client id, object type, name[, organization MOID])
+_MOID_CACHE = {}
+# (api client id, object type) pairs whose complete list is in _MOID_CACHE; see prefetch_moids()
+_PREFETCHED_TYPES = set()
+# Profiles that could not be created through the API, reported for manual creation
+profiles_for_manual_creation = []
+# Guards profiles_for_manual_creation; profiles are created from worker threads
+_MANUAL_CREATION_LOCK = threading.Lock()
+# Shared state for create_rate_limit()
+_CREATE_SEMAPHORE = threading.Semaphore(MAX_CONCURRENT_CREATES)
+_CREATE_RATE_LOCK = threading.Lock()
+_next_create_at = 0.0
+# vNIC names by (api client id, LAN connectivity policy MOID); see get_lan_vnic_names()
+_VNIC_NAME_CACHE = {}
+
+# List call used to look up each policy and pool type by name: (API class, list method)
+MOID_LIST_CALLS = {
+    "bios.Policy": (bios_api.BiosApi, "get_bios_policy_list"),
+    "boot.PrecisionPolicy": (boot_api.BootApi, "get_boot_precision_policy_list"),
+    "fabric.EthNetworkGroupPolicy": (fabric_api.FabricApi, "get_fabric_eth_network_group_policy_list"),
+    "macpool.Pool": (macpool_api.MacpoolApi, "get_macpool_pool_list"),
+    "storage.StoragePolicy": (storage_api.StorageApi, "get_storage_storage_policy_list"),
+    "storage.StoragePolicies": (storage_api.StorageApi, "get_storage_storage_policy_list"),
+    "vnic.EthAdapterPolicy": (vnic_api.VnicApi, "get_vnic_eth_adapter_policy_list"),
+    "vnic.EthQosPolicy": (vnic_api.VnicApi, "get_vnic_eth_qos_policy_list"),
+    "vnic.LanConnectivityPolicy": (vnic_api.VnicApi, "get_vnic_lan_connectivity_policy_list"),
+}
+# Page size for prefetch_moids(); a full page means the list may be incomplete
+PREFETCH_PAGE_SIZE = 1000
+
+# VLAN settings shared by the fabric A and B network group policies of a vNIC policy
+VLAN_DEFAULTS = {"native_vlan": 1, "allowed_vlans": "2-100"}
+
+# On-disk cache for read-only inventory lookups, shared across runs
+DISK_CACHE_DIR = pathlib.Path('~/.cache/intersight_master_node').expanduser()
+DISK_CACHE_ENABLED = True
+
 # Current version of the template
 TEMPLATE_VERSION = "1.0.0"
 
+# Longest comma-separated list Excel accepts inline in a list validation
+EXCEL_LIST_FORMULA_LIMIT = 255
+
+# Shared header styles, registered on a workbook the first time a cell uses them.
+# All headers should be black, even those with asterisks
+HEADER_STYLE = NamedStyle(
+    name='ai_pod_header',
+    fill=PatternFill(start_color='FFA0D7BE', end_color='FFA0D7BE', fill_type='solid'),  # Light green
+    font=Font(color='FF000000', bold=True),
+    alignment=Alignment(horizontal='center')
+)
+INFO_HEADER_STYLE = NamedStyle(
+    name='ai_pod_info_header',
+    fill=PatternFill(start_color='FF1F497D', end_color='FF1F497D', fill_type='solid'),
+    font=Font(color='FFFFFFFF', bold=True)
+)
+BOLD_FONT = Font(bold=True)
+
 # Global dictionary to store template name mappings
 template_mappings = {}
 
@@ -116,23 +194,26 @@ def auto_adjust_column_width(worksheet, min_width=15, padding=2, custom_width_ma
     if not sheet_name and hasattr(worksheet, 'title'):
         sheet_name = worksheet.title
     
+    # Track the longest value per column in a single pass over the cell values
+    max_lengths = {}
+    for row in worksheet.iter_rows(values_only=True):
+        for col_idx, value in enumerate(row, 1):
+            if not value:
+                continue
+            # Handle different data types
+            if isinstance(value, str):
+                cell_len = len(value)
+            elif isinstance(value, date):
+                cell_len = len(value.strftime('%Y-%m-%d %H:%M:%S'))
+            else:
+                cell_len = len(str(value))
+            if cell_len > max_lengths.get(col_idx, 0):
+                max_lengths[col_idx] = cell_len
+    
     adjusted_columns = []
-    for column in worksheet.columns:
-        col_letter = get_column_letter(column[0].column)
-        # Calculate max length of content in the column
-        max_length = 0
-        for cell in column:
-            if cell.value:
-                # Handle different data types
-                if isinstance(cell.value, (int, float)):
-                    cell_len = len(str(cell.value))
-                elif isinstance(cell.value, str):
-                    cell_len = len(cell.value)
-                elif isinstance(cell.value, (datetime.datetime, datetime.date)):
-                    cell_len = len(cell.value.strftime('%Y-%m-%d %H:%M:%S'))
-                else:
-                    cell_len = len(str(cell.value))
-                max_length = max(max_length, cell_len)
+    for col_idx in range(1, worksheet.max_column + 1):
+        col_letter = get_column_letter(col_idx)
+        max_length = max_lengths.get(col_idx, 0)
         
         # Get minimum width from custom map or use default
         col_min_width = custom_width_map.get(col_letter, min_width)
@@ -191,43 +272,144 @@ def cached_api_call(timeout_minutes=5):
         def wrapper(*args, **kwargs):
             # Create a cache key based on function name and arguments
             key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
-            now = datetime.datetime.now()
+            now = datetime.now()
             
             # Check if result is in cache and not expired
             if key in API_CACHE and (now - API_CACHE[key]['timestamp']).total_seconds() < timeout_minutes * 60:
                 print(f"Using cached result for {func.__name__}")
                 return API_CACHE[key]['data']
             
-            # Call the actual function
+            # Call the actual function; failures are not cached
             try:
                 result = func(*args, **kwargs)
             except Exception as e:
-                print(f"Error updating Excel file with Intersight info: {str(e)}")
-                import traceback
-                traceback.print_exc()
-                return False
+                print(f"Error calling {func.__name__}: {str(e)}")
+                raise
             
             # Store result in cache
             API_CACHE[key] = {'data': result, 'timestamp': now}
             return result
         return wrapper
     return decorator
-from intersight.model.vnic_lan_connectivity_policy import VnicLanConnectivityPolicy
-from intersight.model.vnic_eth_if import VnicEthIf
-from intersight.model.vnic_eth_adapter_policy import VnicEthAdapterPolicy
-from intersight.model.vnic_eth_qos_policy import VnicEthQosPolicy
+
+def disk_cache(name, timeout_minutes=5):
+    """Decorator to keep JSON-serializable API results on disk between runs.
+    
+    Entries are per Intersight account (host and API key id), expire by file
+    age, and any read or write problem falls back to calling the API.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(api_client, *args, **kwargs):
+            if not DISK_CACHE_ENABLED:
+                return func(api_client, *args, **kwargs)
+            
+            config = api_client.configuration
+            key_id = getattr(config.signing_info, 'key_id', '') if config.signing_info else ''
+            account = hashlib.sha256(f"{config.host}|{key_id}".encode('utf-8')).hexdigest()[:16]
+            cache_file = DISK_CACHE_DIR / f"{name}-{account}.json"
+            
+            try:
+                if time.time() - cache_file.stat().st_mtime < timeout_minutes * 60:
+                    with cache_file.open('r', encoding='utf-8') as f:
+                        return json.load(f)
+            except (OSError, ValueError):
+                pass
+            
+            result = func(api_client, *args, **kwargs)
+            
+            # Write to a temporary file first so readers never see a partial file
+            tmp_name = None
+            try:
+                DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=DISK_CACHE_DIR,
+                                                 suffix='.tmp', delete=False) as f:
+                    tmp_name = f.name
+                    json.dump(result, f)
+                os.replace(tmp_name, cache_file)
+            except (OSError, TypeError) as e:
+                logger.debug("Could not write disk cache %s: %s", cache_file, e)
+                if tmp_name is not None:
+                    try:
+                        os.remove(tmp_name)
+                    except OSError:
+                        pass
+            return result
+        return wrapper
+    return decorator
+from intersight.model.bios_policy import BiosPolicy
+from intersight.model.boot_device_base import BootDeviceBase
+from intersight.model.boot_precision_policy import BootPrecisionPolicy
+from intersight.model.boot_pxe import BootPxe
+from intersight.model.boot_uefi_shell import BootUefiShell
+from intersight.model.compute_physical_relationship import ComputePhysicalRelationship
 from intersight.model.fabric_eth_network_group_policy import FabricEthNetworkGroupPolicy
+from intersight.model.macpool_block import MacpoolBlock
+from intersight.model.macpool_pool import MacpoolPool
+from intersight.model.mo_mo_ref import MoMoRef
+from intersight.model.organization_organization_relationship import OrganizationOrganizationRelationship
+from intersight.model.server_profile import ServerProfile
 from intersight.model.server_profile_template import ServerProfileTemplate
+from intersight.model.storage_r0_drive import StorageR0Drive
+from intersight.model.storage_storage_policy import StorageStoragePolicy
+from intersight.model.storage_virtual_drive_policy import StorageVirtualDrivePolicy
+from intersight.model.uuidpool_pool import UuidpoolPool
+from intersight.model.uuidpool_uuid_block import UuidpoolUuidBlock
+from intersight.model.vnic_eth_adapter_policy import VnicEthAdapterPolicy
+from intersight.model.vnic_eth_if import VnicEthIf
+from intersight.model.vnic_eth_qos_policy import VnicEthQosPolicy
+from intersight.model.vnic_lan_connectivity_policy import VnicLanConnectivityPolicy
 import time
 import argparse
 import sys
 import re
-from copy import copy
+import types
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# JSON decoder for responses read without the SDK's deserializer (see bulk_create)
+json_loads = orjson.loads if orjson is not None else json.loads
+
+def split_server_option(value):
+    """Split a server dropdown value of the form "Name | SN: XYZ" into (name, serial or None)"""
+    name, sep, serial = value.partition(" | SN: ")
+    if sep:
+        return name.strip(), serial.strip()
+    return value.partition(" | ")[0].strip(), None
+
+def enable_fast_json():
+    """
+    Serialize Intersight request bodies with orjson when it is installed.
+    
+    The SDK dumps each body twice: once in intersight.signing for the request
+    digest and once in intersight.rest for the payload. Both modules are switched
+    together so the signed digest always matches the bytes that are sent.
+    """
+    if orjson is None:
+        return False
+    
+    fast_json = types.SimpleNamespace(
+        dumps=lambda obj, **kwargs: orjson.dumps(obj).decode('utf-8'),
+        loads=orjson.loads
+    )
+    intersight.signing.json = fast_json
+    intersight.rest.json = fast_json
+    return True
 
 def get_api_client():
     """
-    Create an Intersight API client using the API key file
+    Create an Intersight API client using the API key file.
+    
+    The client is created once per process and shared, so every call reuses
+    the same urllib3 connection pool instead of opening new TLS sessions.
     """
+    global _API_CLIENT
+    if _API_CLIENT is not None:
+        return _API_CLIENT
+    
     try:
         # Get API key details from environment variables
         api_key_id = os.getenv('INTERSIGHT_API_KEY_ID')
@@ -255,22 +437,35 @@ def get_api_client():
             )
         )
         
+        # Size the connection pool for the concurrent batches so worker threads
+        # don't discard and re-open connections
+        config.connection_pool_maxsize = MAX_API_WORKERS
+        
         # Create API client
-        api_client = ApiClient(configuration=config)
-        return api_client
+        # pool_threads sizes the thread pool behind async_req=True calls
+        _API_CLIENT = ApiClient(configuration=config, pool_threads=MAX_API_WORKERS)
+        enable_fast_json()
+        return _API_CLIENT
         
     except Exception as e:
         print(f"Error creating API client: {str(e)}")
         return None
 
+@functools.lru_cache(maxsize=None)
+def get_organization_api(api_client):
+    """
+    Get the OrganizationApi instance for a client, creating it only once
+    """
+    return organization_api.OrganizationApi(api_client)
+
 @cached_api_call(timeout_minutes=10)
 def get_organizations(api_client):
     """
     Get list of organizations from Intersight
     """
     try:
-        # Create API instance for organizations
-        api_instance = organization_api.OrganizationApi(api_client)
+        # Get API instance for organizations
+        api_instance = get_organization_api(api_client)
         
         # Get list of organizations
         orgs = api_instance.get_organization_organization_list()
@@ -292,27 +487,82 @@ def get_organizations(api_client):
         return ["default"]
         
     try:
-        # Import here to avoid circular imports
-        from intersight.api import organization_api, compute_api, server_api, vnic_api, bios_api, boot_api, storage_api, resource_api as resource_api_module_client
-        print("Debug: Successfully created organization API client")
-        
-        orgs = org_api.get_organization_organization_list()
-        print(f"Debug: Found organizations: {[org.name for org in orgs.results]}")
-        
-        return [org.name for org in orgs.results] if orgs.results else ["default"]
+        org_names = _get_organization_names(api_client)
+        print(f"Debug: Found organizations: {org_names}")
+        return org_names or ["default"]
     except Exception as e:
         print(f"Debug: Error fetching organizations: {str(e)}")
         return ["default"]
 
+@disk_cache('organizations', timeout_minutes=10)
+def _get_organization_names(api_client):
+    """
+    Fetch organization names, cached on disk between runs
+    """
+    orgs = get_organization_api(api_client).get_organization_organization_list()
+    return [org.name for org in orgs.results]
+
+@cached_api_call(timeout_minutes=5)
+@disk_cache('organization_moids')
+def get_organization_moid_map(api_client):
+    """
+    Map organization names to MOIDs using a single list call
+    """
+    api_instance = get_organization_api(api_client)
+    orgs = api_instance.get_organization_organization_list()
+    return {org.name: org.moid for org in orgs.results}
+
+@cached_api_call(timeout_minutes=5)
+def get_server_profile_templates(api_client):
+    """
+    Get name and MOID of all server profile templates using a single list call
+    """
+    api_instance = server_api.ServerApi(api_client)
+    templates = api_instance.get_server_profile_template_list(select="Name,Moid").results
+    return [{'name': tmpl.name, 'moid': tmpl.moid} for tmpl in templates]
+
+@cached_api_call(timeout_minutes=5)
+@disk_cache('managed_servers')
+def get_managed_servers(api_client):
+    """
+    Get name, serial and MOID of all managed servers using a single list call
+    """
+    api_instance = compute_api.ComputeApi(api_client)
+    response = api_instance.get_compute_physical_summary_list(
+        filter="ManagementMode eq 'IntersightStandalone' or ManagementMode eq 'UCSM' or ManagementMode eq 'Intersight'",
+        select="Name,Serial,Moid"
+    )
+    return [{'name': server.name, 'serial': server.serial, 'moid': server.moid} for server in response.results]
+
+@cached_api_call(timeout_minutes=5)
+@disk_cache('rack_units')
+def get_rack_units(api_client):
+    """
+    Get name, serial and model of all rack servers using a single list call
+    """
+    api_instance = compute_api.ComputeApi(api_client)
+    response = api_instance.get_compute_rack_unit_list(select="Name,Serial,Model")
+    return [{'name': server.name, 'serial': server.serial, 'model': server.model} for server in response.results]
+
+@cached_api_call(timeout_minutes=5)
+def get_managed_server_index(api_client):
+    """
+    Index managed servers by lower-cased serial and name for exact lookups
+    """
+    by_serial = {}
+    by_name = {}
+    for server in get_managed_servers(api_client):
+        # Keep the first server for each key, matching the old linear scan
+        if server['serial']:
+            by_serial.setdefault(server['serial'].lower(), server)
+        if server['name']:
+            by_name.setdefault(server['name'].lower(), server)
+    return by_serial, by_name
+
 def create_mac_pool(api_client, pool_data):
     """
     Create a MAC Pool in Intersight
     """
-    from intersight.api import macpool_api
-    from intersight.model.macpool_pool import MacpoolPool
-    from intersight.model.macpool_block import MacpoolBlock
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client, "Gruve")
@@ -320,16 +570,6 @@ def create_mac_pool(api_client, pool_data):
             print("Error: Gruve organization not found")
             return False
 
-        # Use organization API to fetch organizations
-        org_api = organization_api.OrganizationApi(api_client)
-        orgs = org_api.get_organization_organization_list()
-        org_names = [org.name for org in orgs.results]
-        
-        # Use compute API to fetch servers
-        compute_api_instance = compute_api.ComputeApi(api_client)
-        servers_list = compute_api_instance.get_compute_rack_unit_list()
-        servers = servers_list.results
-        
         # Create organization reference
         org_ref = MoMoRef(
             class_id="mo.MoRef",
@@ -364,19 +604,13 @@ def create_mac_pool(api_client, pool_data):
         
     except Exception as e:
         print(f"Error creating MAC Pool: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 def create_uuid_pool(api_client, pool_data):
     """
     Create a UUID Pool in Intersight
     """
-    from intersight.api import uuidpool_api
-    from intersight.model.uuidpool_pool import UuidpoolPool
-    from intersight.model.uuidpool_uuid_block import UuidpoolUuidBlock
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client, "Gruve")
@@ -419,8 +653,7 @@ def create_uuid_pool(api_client, pool_data):
         
     except Exception as e:
         print(f"Error creating UUID Pool: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 def format_uuid_suffix(uuid_str):
@@ -441,12 +674,10 @@ def pool_exists(api_client, pool_type, pool_name):
 
         # Create API instance based on pool type
         if pool_type == 'MAC Pool':
-            from intersight.api import macpool_api
             api_instance = macpool_api.MacpoolApi(api_client)
             filter_str = f"Name eq '{pool_name}' and Organization.Moid eq '{org_moid}'"
             api_response = api_instance.get_macpool_pool_list(filter=filter_str)
         elif pool_type == 'UUID Pool':
-            from intersight.api import uuidpool_api
             api_instance = uuidpool_api.UuidpoolApi(api_client)
             filter_str = f"Name eq '{pool_name}' and Organization.Moid eq '{org_moid}'"
             api_response = api_instance.get_uuidpool_pool_list(filter=filter_str)
@@ -500,29 +731,56 @@ def create_pool(api_client, pool_data):
             
     except Exception as e:
         print(f"Error creating pool: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 def get_mac_pool_moid(api_client, pool_name, org_moid):
     """
     Get the MOID of a MAC Pool by name and organization MOID
     """
-    from intersight.api import macpool_api
+    key = (id(api_client), "macpool.Pool", pool_name, org_moid)
+    if key in _MOID_CACHE:
+        return _MOID_CACHE[key]
     
+    # One list call covers every pool, so remember all of them
     api_instance = macpool_api.MacpoolApi(api_client)
     pools = api_instance.get_macpool_pool_list()
-    for pool in pools.results:
-        if pool.name == pool_name and pool.organization.moid == org_moid:
-            return pool.moid
-    return None
+    remember_moids(api_client, "macpool.Pool", pools.results)
+    return _MOID_CACHE.get(key)
+
+def remember_moids(api_client, object_type, objects):
+    """Record the MOIDs of listed policies or pools in _MOID_CACHE"""
+    for obj in objects:
+        _MOID_CACHE[(id(api_client), object_type, obj.name)] = obj.moid
+        if object_type == "macpool.Pool" and obj.organization:
+            _MOID_CACHE[(id(api_client), object_type, obj.name, obj.organization.moid)] = obj.moid
+
+def prefetch_moids(api_client, object_types=None):
+    """List each policy and pool type once so later name lookups and existence checks skip the API"""
+    if object_types is None:
+        object_types = [t for t in MOID_LIST_CALLS if t != "storage.StoragePolicies"]
+    
+    def list_objects(object_type):
+        api_class, list_method = MOID_LIST_CALLS[object_type]
+        return getattr(api_class(api_client), list_method)(select="Moid,Name,Organization", top=PREFETCH_PAGE_SIZE).results
+    
+    with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+        future_to_type = {executor.submit(list_objects, t): t for t in object_types}
+        for future in concurrent.futures.as_completed(future_to_type):
+            object_type = future_to_type[future]
+            try:
+                objects = future.result()
+            except Exception as e:
+                print(f"Could not prefetch {object_type} list: {str(e)}")
+                continue
+            remember_moids(api_client, object_type, objects)
+            if len(objects) < PREFETCH_PAGE_SIZE:
+                _PREFETCHED_TYPES.add((id(api_client), object_type))
 
 def get_pool_moid(api_client, pool_name):
     """
     Get the MOID of a pool by name
     """
-    from intersight.api import macpool_api
-    
     api_instance = macpool_api.MacpoolApi(api_client)
     pools = api_instance.get_macpool_pool_list(filter=f"Name eq '{pool_name}'").results
     
@@ -533,35 +791,21 @@ def get_pool_moid(api_client, pool_name):
 
 def get_policy_moid(api_client, policy_type, policy_name):
     """Get the MOID of a policy by name"""
+    key = (id(api_client), policy_type, policy_name)
+    if key in _MOID_CACHE:
+        return _MOID_CACHE[key]
+    
     try:
-        if policy_type == "bios.Policy":
-            api_instance = bios_api.BiosApi(api_client)
-            policies = api_instance.get_bios_policy_list()
-        elif policy_type == "vnic.LanConnectivityPolicy":
-            api_instance = vnic_api.VnicApi(api_client)
-            policies = api_instance.get_vnic_lan_connectivity_policy_list()
-        elif policy_type == "vnic.EthQosPolicy":
-            api_instance = vnic_api.VnicApi(api_client)
-            policies = api_instance.get_vnic_eth_qos_policy_list()
-        elif policy_type == "storage.StoragePolicy":
-            api_instance = storage_api.StorageApi(api_client)
-            policies = api_instance.get_storage_storage_policy_list()
-        elif policy_type == "macpool.Pool":
-            api_instance = macpool_api.MacpoolApi(api_client)
-            policies = api_instance.get_macpool_pool_list()
-        elif policy_type == "boot.PrecisionPolicy":
-            api_instance = boot_api.BootApi(api_client)
-            policies = api_instance.get_boot_precision_policy_list()
-        elif policy_type == "storage.StoragePolicies":
-            api_instance = storage_api.StorageApi(api_client)
-            policies = api_instance.get_storage_storage_policy_list()
-        else:
+        if policy_type not in MOID_LIST_CALLS:
             raise Exception(f"Unsupported policy type: {policy_type}")
-        
-        # Find the policy by name
-        for policy in policies.results:
-            if policy.name == policy_name:
-                return policy.moid
+        api_class, list_method = MOID_LIST_CALLS[policy_type]
+        policies = getattr(api_class(api_client), list_method)()
+        
+        # One list call covers every policy of this type, so remember all of them;
+        # misses are not cached because the policy may be created later in the run
+        remember_moids(api_client, policy_type, policies.results)
+        if key in _MOID_CACHE:
+            return _MOID_CACHE[key]
                 
         print(f"Policy {policy_name} not found")
         return None
@@ -574,6 +818,13 @@ def policy_exists(api_client, policy_type, policy_name):
     """
     Check if a policy already exists in Intersight
     """
+    # Answer from the prefetched lists when possible
+    key = (id(api_client), policy_type, policy_name)
+    if key in _MOID_CACHE:
+        return True
+    if key[:2] in _PREFETCHED_TYPES:
+        return False
+    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client)
@@ -609,75 +860,54 @@ def policy_exists(api_client, policy_type, policy_name):
         print(f"Error checking if policy exists: {str(e)}")
         return False
 
+def get_lan_vnic_names(api_client, lan_connectivity_moid):
+    """Return the names of all vNICs in a LAN Connectivity Policy, listed once per policy"""
+    key = (id(api_client), lan_connectivity_moid)
+    if key not in _VNIC_NAME_CACHE:
+        vnic_instance = vnic_api.VnicApi(api_client)
+        vnic_list = vnic_instance.get_vnic_eth_if_list(
+            filter=f"LanConnectivityPolicy.Moid eq '{lan_connectivity_moid}'",
+            select="Name"
+        )
+        _VNIC_NAME_CACHE[key] = {vnic.name for vnic in vnic_list.results}
+    return _VNIC_NAME_CACHE[key]
+
 def check_vnic_exists(api_client, vnic_name, lan_connectivity_moid):
     """
     Check if a vNIC already exists in the LAN Connectivity Policy
     """
     try:
-        vnic_instance = vnic_api.VnicApi(api_client)
-        vnic_list = vnic_instance.get_vnic_eth_if_list(filter=f"Name eq '{vnic_name}'")
-        for vnic in vnic_list.results:
-            if hasattr(vnic, 'lan_connectivity_policy') and vnic.lan_connectivity_policy.moid == lan_connectivity_moid:
-                return True
-        return False
+        return vnic_name in get_lan_vnic_names(api_client, lan_connectivity_moid)
     except Exception as e:
         print(f"Error checking vNIC existence: {str(e)}")
         return False
 
 def move_sheet_after(workbook, sheet_to_move, target_sheet):
     """Move a worksheet to be right after another worksheet"""
-    if target_sheet not in workbook.sheetnames or sheet_to_move not in workbook.sheetnames:
+    sheet_names = workbook.sheetnames
+    if target_sheet not in sheet_names or sheet_to_move not in sheet_names:
         return False
         
     # Get the indices
-    target_index = workbook.sheetnames.index(target_sheet)
-    current_index = workbook.sheetnames.index(sheet_to_move)
+    target_index = sheet_names.index(target_sheet)
+    current_index = sheet_names.index(sheet_to_move)
     
     # If sheet is already after target, do nothing
     if current_index == target_index + 1:
         return True
         
-    # Remove and insert at new position
-    sheet = workbook[sheet_to_move]
-    workbook.remove(sheet)
-    workbook.create_sheet(sheet_to_move, target_index + 1)
-    
-    # Copy the removed sheet to the new position
-    new_sheet = workbook[sheet_to_move]
-    for row in sheet.iter_rows():
-        for cell in row:
-            new_sheet[cell.coordinate].value = cell.value
-            if cell.has_style:
-                new_sheet[cell.coordinate].font = copy(cell.font)
-                new_sheet[cell.coordinate].border = copy(cell.border)
-                new_sheet[cell.coordinate].fill = copy(cell.fill)
-                new_sheet[cell.coordinate].number_format = copy(cell.number_format)
-                new_sheet[cell.coordinate].protection = copy(cell.protection)
-                new_sheet[cell.coordinate].alignment = copy(cell.alignment)
-    
-    # Copy sheet properties
-    new_sheet.sheet_format = copy(sheet.sheet_format)
-    new_sheet.sheet_properties = copy(sheet.sheet_properties)
-    new_sheet.merged_cells = copy(sheet.merged_cells)
-    new_sheet.page_margins = copy(sheet.page_margins)
-    new_sheet.page_setup = copy(sheet.page_setup)
-    
-    # Copy column dimensions
-    for key, value in sheet.column_dimensions.items():
-        new_sheet.column_dimensions[key] = copy(value)
-    
-    # Copy row dimensions
-    for key, value in sheet.row_dimensions.items():
-        new_sheet.row_dimensions[key] = copy(value)
+    # Shift the existing worksheet in place so its cells, styles and
+    # validations stay attached instead of being copied cell by cell
+    if current_index > target_index:
+        workbook.move_sheet(sheet_to_move, target_index + 1 - current_index)
+    else:
+        workbook.move_sheet(sheet_to_move, target_index - current_index)
+    return True
 
 def create_default_bios_policy(api_client, policy_name, org_name):
     """
     Create a default BIOS policy with standard settings
     """
-    from intersight.api import bios_api
-    from intersight.model.bios_policy import BiosPolicy
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client, org_name)
@@ -716,11 +946,6 @@ def create_default_boot_policy(api_client, policy_name, org_name):
     """
     Create a default Boot policy with standard settings
     """
-    from intersight.api import boot_api
-    from intersight.model.boot_precision_policy import BootPrecisionPolicy
-    from intersight.model.boot_device_base import BootDeviceBase
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client, org_name)
@@ -781,14 +1006,6 @@ def create_default_lan_policy(api_client, policy_name, org_name):
     """
     Create a default LAN Connectivity policy with standard settings
     """
-    from intersight.api import vnic_api, macpool_api, fabric_api
-    from intersight.model.vnic_lan_connectivity_policy import VnicLanConnectivityPolicy
-    from intersight.model.vnic_eth_if import VnicEthIf
-    from intersight.model.vnic_eth_adapter_policy import VnicEthAdapterPolicy
-    from intersight.model.vnic_eth_qos_policy import VnicEthQosPolicy
-    from intersight.model.fabric_eth_network_group_policy import FabricEthNetworkGroupPolicy  # Correct Network Group Policy
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client, org_name)
@@ -852,7 +1069,7 @@ def create_default_lan_policy(api_client, policy_name, org_name):
             moid=mac_pool_b_moid
         )
         
-        # Create LAN Connectivity policy first
+        # LAN Connectivity policy
         lan_policy = VnicLanConnectivityPolicy(
             name=policy_name,
             description="Default LAN Connectivity Policy for AI workloads",
@@ -861,12 +1078,7 @@ def create_default_lan_policy(api_client, policy_name, org_name):
             target_platform="FIAttached"
         )
         
-        # Create API instance
-        api_instance = vnic_api.VnicApi(api_client)
-        result = api_instance.create_vnic_lan_connectivity_policy(vnic_lan_connectivity_policy=lan_policy)
-        print(f"Successfully created default LAN Connectivity Policy: {result.name}")
-        
-        # First create an ethernet adapter policy
+        # Ethernet adapter policy
         adapter_policy_name = f"{policy_name}_EthAdapter"
         adapter_policy = VnicEthAdapterPolicy(
             name=adapter_policy_name,
@@ -878,18 +1090,7 @@ def create_default_lan_policy(api_client, policy_name, org_name):
             # Removed both interrupt_settings and tcp_offload_settings
         )
         
-        # Create the adapter policy
-        adapter_result = api_instance.create_vnic_eth_adapter_policy(vnic_eth_adapter_policy=adapter_policy)
-        print(f"Successfully created Ethernet Adapter Policy: {adapter_result.name}")
-        
-        # Create adapter policy reference
-        adapter_policy_ref = MoMoRef(
-            class_id="mo.MoRef",
-            object_type="vnic.EthAdapterPolicy",
-            moid=adapter_result.moid
-        )
-        
-        # Create QoS policy (mandatory for vNICs)
+        # QoS policy (mandatory for vNICs)
         qos_policy_name = f"{policy_name}_QoS"
         qos_policy = VnicEthQosPolicy(
             name=qos_policy_name,
@@ -903,18 +1104,7 @@ def create_default_lan_policy(api_client, policy_name, org_name):
             priority="Best Effort"  # Valid options are Best Effort, FC, Platinum, Gold, Silver, Bronze
         )
         
-        # Create the QoS policy
-        qos_result = api_instance.create_vnic_eth_qos_policy(vnic_eth_qos_policy=qos_policy)
-        print(f"Successfully created Ethernet QoS Policy: {qos_result.name}")
-        
-        # Create QoS policy reference
-        qos_policy_ref = MoMoRef(
-            class_id="mo.MoRef",
-            object_type="vnic.EthQosPolicy",
-            moid=qos_result.moid
-        )
-        
-        # Create Network Group Policy (mandatory for vNICs) - this is different from Ethernet Network Policy
+        # Network Group Policy (mandatory for vNICs) - this is different from Ethernet Network Policy
         network_group_policy_name = f"{policy_name}_NetworkGroup"
         network_group_policy = FabricEthNetworkGroupPolicy(
             name=network_group_policy_name,
@@ -926,13 +1116,34 @@ def create_default_lan_policy(api_client, policy_name, org_name):
             }
         )
         
-        # Create the Network Group policy using the appropriate API instance
-        fabric_api_instance = fabric_api.FabricApi(api_client)
-        network_group_result = fabric_api_instance.create_fabric_eth_network_group_policy(
-            fabric_eth_network_group_policy=network_group_policy
-        )
+        # These four policies don't reference each other, so create them in one bulk
+        # request. The LAN policy goes first: with ActionOnError Stop a failure there
+        # (e.g. it already exists) leaves no orphaned adapter, QoS or network group policies
+        result, adapter_result, qos_result, network_group_result = bulk_create(api_client, [
+            ('/vnic/LanConnectivityPolicies', VnicLanConnectivityPolicy, lan_policy),
+            ('/vnic/EthAdapterPolicies', VnicEthAdapterPolicy, adapter_policy),
+            ('/vnic/EthQosPolicies', VnicEthQosPolicy, qos_policy),
+            ('/fabric/EthNetworkGroupPolicies', FabricEthNetworkGroupPolicy, network_group_policy),
+        ])
+        print(f"Successfully created default LAN Connectivity Policy: {result.name}")
+        print(f"Successfully created Ethernet Adapter Policy: {adapter_result.name}")
+        print(f"Successfully created Ethernet QoS Policy: {qos_result.name}")
         print(f"Successfully created Ethernet Network Group Policy: {network_group_result.name}")
         
+        # Create adapter policy reference
+        adapter_policy_ref = MoMoRef(
+            class_id="mo.MoRef",
+            object_type="vnic.EthAdapterPolicy",
+            moid=adapter_result.moid
+        )
+        
+        # Create QoS policy reference
+        qos_policy_ref = MoMoRef(
+            class_id="mo.MoRef",
+            object_type="vnic.EthQosPolicy",
+            moid=qos_result.moid
+        )
+        
         # Create Network Group policy reference
         network_group_policy_ref = MoMoRef(
             class_id="mo.MoRef",
@@ -983,10 +1194,17 @@ def create_default_lan_policy(api_client, policy_name, org_name):
             )
         )
         
-        # Check if vNICs already exist before creating
+        # Both vNICs only depend on the policies above, so create them together too,
+        # still paced by the create rate limit
+        api_instance = vnic_api.VnicApi(api_client)
+        with create_rate_limit():
+            vnic_a_request = api_instance.create_vnic_eth_if(vnic_eth_if=vnic_eth_a, async_req=True)
+        with create_rate_limit():
+            vnic_b_request = api_instance.create_vnic_eth_if(vnic_eth_if=vnic_eth_b, async_req=True)
+        
         try:
-            # Try to create vNIC for Fabric A
-            vnic_a_result = api_instance.create_vnic_eth_if(vnic_eth_if=vnic_eth_a)
+            # Wait for the vNIC for Fabric A
+            vnic_a_result = vnic_a_request.get()
             print(f"Successfully created vNIC for Fabric A: {vnic_a_result.name}")
         except Exception as e:
             if "duplicate" in str(e).lower():
@@ -996,8 +1214,8 @@ def create_default_lan_policy(api_client, policy_name, org_name):
                 # Continue with the process despite the error
         
         try:  
-            # Try to create vNIC for Fabric B
-            vnic_b_result = api_instance.create_vnic_eth_if(vnic_eth_if=vnic_eth_b)
+            # Wait for the vNIC for Fabric B
+            vnic_b_result = vnic_b_request.get()
             print(f"Successfully created vNIC for Fabric B: {vnic_b_result.name}")
         except Exception as e:
             if "duplicate" in str(e).lower():
@@ -1016,10 +1234,6 @@ def create_default_storage_policy(api_client, policy_name, org_name):
     """
     Create a default Storage policy with standard settings
     """
-    from intersight.api import storage_api
-    from intersight.model.storage_storage_policy import StorageStoragePolicy
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get organization MOID
         org_moid = get_org_moid(api_client, org_name)
@@ -1058,11 +1272,6 @@ def create_server_template(api_client, template_data):
     """
     Create a Server Profile Template in Intersight
     """
-    from intersight.api import server_api
-    from intersight.model.server_profile_template import ServerProfileTemplate
-    from intersight.model.mo_mo_ref import MoMoRef
-    import uuid
-    
     try:
         # Handle different column formats - with or without asterisk
         if 'Template Name*' in template_data:
@@ -1255,23 +1464,21 @@ def create_server_template(api_client, template_data):
         
     except Exception as e:
         print(f"Error creating Server Template: {str(e)}")
-        traceback.print_exc()
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 def get_server_moid(api_client, server_name):
     """
     Get the MOID of a server by name or serial number with flexible matching
     """
-    from intersight.api import compute_api
-    
     if not server_name or pd.isna(server_name):
         return None
         
     server_name = str(server_name).strip()
     
     # Check if we received a combined format "SERIAL | NAME"
-    if " | " in server_name:
-        serial, name = server_name.split(" | ", 1)
+    serial, sep, name = server_name.partition(" | ")
+    if sep:
         serial = serial.strip()
         name = name.strip()
     else:
@@ -1282,40 +1489,38 @@ def get_server_moid(api_client, server_name):
     try:
         print(f"Finding server with name: {name} or serial: {serial}")
         
-        # Get all managed servers
-        api_instance = compute_api.ComputeApi(api_client)
-        response = api_instance.get_compute_physical_summary_list(
-            filter="ManagementMode eq 'IntersightStandalone' or ManagementMode eq 'UCSM' or ManagementMode eq 'Intersight'"
-        )
-        
-        # Print available servers for debugging
-        print("Available servers:")
-        for server in response.results:
-            print(f"  - {server.name} (Serial: {server.serial}, MOID: {server.moid})")
-        
-        # Try finding server by serial first
-        for server in response.results:
-            if server.serial and server.serial.lower() == serial.lower():
-                print(f"Found server by exact serial match: {server.name} (MOID: {server.moid})")
-                return server.moid
-        
-        # Then try by name
-        for server in response.results:
-            if server.name and server.name.lower() == name.lower():
-                print(f"Found server by exact name match: {server.name} (MOID: {server.moid})")
-                return server.moid
+        # Get all managed servers (shared across lookups in this run)
+        servers = get_managed_servers(api_client)
+        
+        # Log available servers for debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Available servers:")
+            for server in servers:
+                logger.debug("  - %s (Serial: %s, MOID: %s)", server['name'], server['serial'], server['moid'])
+        
+        # Try finding server by serial first, then by name
+        by_serial, by_name = get_managed_server_index(api_client)
+        server = by_serial.get(serial.lower())
+        if server:
+            print(f"Found server by exact serial match: {server['name']} (MOID: {server['moid']})")
+            return server['moid']
+        
+        server = by_name.get(name.lower())
+        if server:
+            print(f"Found server by exact name match: {server['name']} (MOID: {server['moid']})")
+            return server['moid']
                 
         # Try partial match on name
-        for server in response.results:
-            if server.name and name.lower() in server.name.lower():
-                print(f"Found server by partial name match: {server.name} (MOID: {server.moid})")
-                return server.moid
+        for server in servers:
+            if server['name'] and name.lower() in server['name'].lower():
+                print(f"Found server by partial name match: {server['name']} (MOID: {server['moid']})")
+                return server['moid']
                 
         # Try partial match on serial
-        for server in response.results:
-            if server.serial and serial.lower() in server.serial.lower():
-                print(f"Found server by partial serial match: {server.serial} (MOID: {server.moid})")
-                return server.moid
+        for server in servers:
+            if server['serial'] and serial.lower() in server['serial'].lower():
+                print(f"Found server by partial serial match: {server['serial']} (MOID: {server['moid']})")
+                return server['moid']
         
         print(f"❌ Server not found: {server_name}")
         return None
@@ -1328,10 +1533,6 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
     """
     Create a profile from template using the approach from Cisco sample code
     """
-    from intersight.api import server_api
-    from intersight.model.server_profile import ServerProfile
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Get profile name - use the name key if available, otherwise Profile Name
         # This handles both formats (from Excel or direct dictionary input)
@@ -1391,8 +1592,8 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
         if deploy.lower() == "yes":
             print(f"Note: The profile will be created but must be deployed manually in the Intersight UI.")
         
-        # Get organization MOID
-        org_moid = get_org_moid(api_client, org_name)
+        # Get organization MOID (shared across profiles in this run)
+        org_moid = get_organization_moid_map(api_client).get(org_name)
         if not org_moid:
             print(f"Error: Organization {org_name} not found")
             return False
@@ -1405,8 +1606,8 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
         )
         
         # Get template MOID - Check if it's in our mappings first
-        if template_name in template_mappings:
-            mapped_name = template_mappings[template_name]
+        mapped_name = template_mappings.get(template_name)
+        if mapped_name is not None:
             print(f"Found template mapping for {template_name} -> {mapped_name}")
             template_moid = get_template_moid(api_client, mapped_name)
         else:
@@ -1426,8 +1627,9 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
         # Parse server info (if provided)
         server_moid = None
         if server_info:
-            server_name = server_info.split(' | ')[0] if ' | ' in server_info else server_info
-            server_moid = get_server_moid(api_client, server_name)
+            # Prefer the serial from "Name | SN: XYZ" values, it is unique per server
+            server_name, serial_number = split_server_option(server_info)
+            server_moid = get_server_moid(api_client, serial_number or server_name)
             if not server_moid:
                 print(f"Error: Server {server_name} not found")
                 return False
@@ -1442,11 +1644,6 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
             )
 
         try:
-            from intersight.model.server_profile import ServerProfile
-            from intersight.model.compute_physical_relationship import ComputePhysicalRelationship
-            from intersight.model.organization_organization_relationship import OrganizationOrganizationRelationship
-            from intersight.api import server_api
-            
             # Create API instance
             api_instance = server_api.ServerApi(api_client)
             
@@ -1553,11 +1750,6 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
                 print("\n⚠️ Unable to create server profile from template due to Intersight API limitations.")
                 print("This profile will need to be created manually in the Intersight UI.")
                 
-                # Store profile for manual creation report
-                if 'profiles_for_manual_creation' not in globals():
-                    global profiles_for_manual_creation
-                    profiles_for_manual_creation = []
-                
                 # Store info needed for manual creation
                 profile_info = {
                     'name': profile_name,
@@ -1566,7 +1758,8 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
                     'server': server_name,
                     'deploy': deploy
                 }
-                profiles_for_manual_creation.append(profile_info)
+                with _MANUAL_CREATION_LOCK:
+                    profiles_for_manual_creation.append(profile_info)
                 
                 return False
             
@@ -1574,44 +1767,39 @@ def create_server_profile(api_client, profile_data, template_name=None, server_n
             
         except Exception as e:
             print(f"Error creating Server Profile: {str(e)}")
-            traceback.print_exc()
+            logger.debug("Traceback for the error above", exc_info=True)
             return False
     
     except Exception as e:
         print(f"Error creating Server Profile: {str(e)}")
-        traceback.print_exc()
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 def get_template_moid(api_client, template_name):
     """
     Get the MOID of a server profile template by name with flexible matching
     """
-    from intersight.api import server_api
-    
     try:
         # Check if there's a mapping entry for this template name
-        if template_name in template_mappings:
-            mapped_name = template_mappings[template_name]
+        mapped_name = template_mappings.get(template_name)
+        if mapped_name is not None:
             print_info(f"Found template mapping for {template_name} -> {mapped_name}")
             template_name = mapped_name
         
-        # Create API instance
+        # First try an exact match with a live query, so a recreated template is never
+        # resolved to a stale MOID
         api_instance = server_api.ServerApi(api_client)
-        
-        # First try exact match
         filter_str = f"Name eq '{template_name}'"
-        response = api_instance.get_server_profile_template_list(filter=filter_str)
+        response = api_instance.get_server_profile_template_list(filter=filter_str, select="Moid")
         
         # Check if exact match template exists
         if response.results and len(response.results) > 0:
             print_success(f"Found exact match for template: {template_name}")
             return response.results[0].moid
             
-        # If exact match not found, try case-insensitive search
+        # If exact match not found, try case-insensitive search against the cached template list
         print_info(f"Exact match for '{template_name}' not found, trying flexible matching...")
-        
-        # Get all templates and search for a close match
-        all_templates = api_instance.get_server_profile_template_list()
+        all_templates = get_server_profile_templates(api_client)
         
         # Flexible matching options (in order of preference):
         # 1. Exact match (already tried above)
@@ -1620,31 +1808,31 @@ def get_template_moid(api_client, template_name):
         # 4. Template name contains our search term
         template_matches = []
         
-        if all_templates.results:
+        if all_templates:
             template_name_lower = template_name.lower()
             
-            for tmpl in all_templates.results:
+            for tmpl in all_templates:
                 # Case-insensitive exact match
-                if tmpl.name.lower() == template_name_lower:
-                    print_success(f"Found case-insensitive match: {tmpl.name}")
-                    return tmpl.moid
+                if tmpl['name'].lower() == template_name_lower:
+                    print_success(f"Found case-insensitive match: {tmpl['name']}")
+                    return tmpl['moid']
                 
                 # Template name starts with our search term
-                if tmpl.name.lower().startswith(template_name_lower):
+                if tmpl['name'].lower().startswith(template_name_lower):
                     template_matches.append((1, tmpl))  # Priority 1
                     continue
                     
                 # Template name contains our search term
-                if template_name_lower in tmpl.name.lower():
+                if template_name_lower in tmpl['name'].lower():
                     template_matches.append((2, tmpl))  # Priority 2
             
             # Sort by priority (lower number is higher priority)
-            template_matches.sort(key=lambda x: x[0])
+            template_matches.sort(key=itemgetter(0))
             
             if template_matches:
                 best_match = template_matches[0][1]
-                print_success(f"Found best match for template '{template_name}': {best_match.name}")
-                return best_match.moid
+                print_success(f"Found best match for template '{template_name}': {best_match['name']}")
+                return best_match['moid']
                 
         print_error(f"No matching template found for '{template_name}'")
         return None
@@ -1660,23 +1848,23 @@ def create_server_template_from_excel(api_client, excel_file):
     try:
         # Read Excel file
         print("\nCreating server templates from Excel...")
-        df_sheets = pd.read_excel(excel_file, sheet_name=None)
-        
-        # Check if we have either Template or Templates sheet
-        template_sheet = None
-        if 'Template' in df_sheets:
-            print("Found 'Template' sheet")
-            template_sheet = 'Template'
-        elif 'Templates' in df_sheets:
-            print("Found 'Templates' sheet")
-            template_sheet = 'Templates'
-        
-        if not template_sheet:
-            print("Warning: Neither 'Template' nor 'Templates' sheet found in the Excel file")
-            return False
-        
-        # Get the template dataframe
-        df_templates = df_sheets[template_sheet]
+        # Open the workbook once and parse only the template sheet
+        with pd.ExcelFile(excel_file) as excel:
+            # Check if we have either Template or Templates sheet
+            template_sheet = None
+            if 'Template' in excel.sheet_names:
+                print("Found 'Template' sheet")
+                template_sheet = 'Template'
+            elif 'Templates' in excel.sheet_names:
+                print("Found 'Templates' sheet")
+                template_sheet = 'Templates'
+            
+            if not template_sheet:
+                print("Warning: Neither 'Template' nor 'Templates' sheet found in the Excel file")
+                return False
+            
+            # Get the template dataframe
+            df_templates = excel.parse(template_sheet)
         
         if df_templates.empty:
             print(f"No templates defined in {template_sheet} sheet.")
@@ -1777,13 +1965,15 @@ def create_server_profiles_from_excel(api_client, excel_file):
             print_warning("No profiles defined in Profiles sheet.")
             return False
         
-        # Print column headers for debugging
-        print("Column headers in Profiles sheet:")
-        print(df_profiles.columns.tolist())
+        # Log column headers for debugging
+        logger.debug("Column headers in Profiles sheet: %s", df_profiles.columns.tolist())
         
         # Count total and deploy-marked profiles for reporting
         total_profiles = 0
         deploy_profiles = 0
+        
+        # Arguments for create_server_profile, one entry per profile to create
+        profile_jobs = []
             
         # Process all profiles in the sheet
         for index, row in df_profiles.iterrows():
@@ -1792,7 +1982,7 @@ def create_server_profiles_from_excel(api_client, excel_file):
             # or if the profile name cell is empty
             
             # Debug the row data
-            print(f"Row {index}: {row.tolist()}")
+            logger.debug("Row %s: %s", index, row.values)
             
             # If profile name is empty, skip
             profile_name_value = row['Profile Name*'] if 'Profile Name*' in row else row.iloc[0] if len(row) > 0 else None
@@ -1804,6 +1994,22 @@ def create_server_profiles_from_excel(api_client, excel_file):
             
             # Get values using column names instead of numeric indices
             profile_name = row['Profile Name*'] if 'Profile Name*' in row.index else row.iloc[0]
+            
+            # Get deploy flag by column name or position
+            if 'Deploy*' in row.index:
+                deploy = row['Deploy*'] if not pd.isna(row['Deploy*']) else "No"
+            else:
+                deploy = row.iloc[7] if len(row) > 7 and not pd.isna(row.iloc[7]) else "No"
+            
+            # Log debug info about each profile
+            logger.debug("  Profile: %s, Deploy value: '%s', Type: %s", profile_name, deploy, type(deploy))
+            
+            # Only process profiles with Deploy set to Yes (case insensitive)
+            deploy_str = str(deploy).strip().lower()
+            if deploy_str != "yes":
+                print(f"  Skipping profile: {profile_name} (Deploy value is '{deploy}', not 'Yes')")
+                continue
+                
             description = row['Description'] if 'Description' in row.index and not pd.isna(row['Description']) else ""
             org_name = row['Organization*'] if 'Organization*' in row.index and not pd.isna(row['Organization*']) else "default"
             
@@ -1825,21 +2031,6 @@ def create_server_profiles_from_excel(api_client, excel_file):
             else:
                 server_name = row.iloc[5] if len(row) > 5 and not pd.isna(row.iloc[5]) else None
                 
-            # Get deploy flag by column name or position
-            if 'Deploy*' in row.index:
-                deploy = row['Deploy*'] if not pd.isna(row['Deploy*']) else "No"
-            else:
-                deploy = row.iloc[7] if len(row) > 7 and not pd.isna(row.iloc[7]) else "No"
-            
-            # Print debug info about each profile
-            print(f"  Profile: {profile_name}, Deploy value: '{deploy}', Type: {type(deploy)}")
-            
-            # Only process profiles with Deploy set to Yes (case insensitive)
-            deploy_str = str(deploy).strip().lower()
-            if deploy_str != "yes":
-                print(f"  Skipping profile: {profile_name} (Deploy value is '{deploy}', not 'Yes')")
-                continue
-                
             deploy_profiles += 1
             print(f"  Creating profile: {profile_name} (Template: {template_name}, Server: {server_name}, Organization: {org_name})")
             
@@ -1854,19 +2045,43 @@ def create_server_profiles_from_excel(api_client, excel_file):
             
             # Convert deploy string to boolean-like string for API call
             deploy_value = "Yes" if deploy_str == "yes" else "No"
-            print(f"  Setting deploy value to: {deploy_value}")
-            
-            # Create the profile
-            create_server_profile(api_client, profile_data, template_name, server_name, deploy_value)
+            logger.debug("  Setting deploy value to: %s", deploy_value)
+            
+            # Queue the profile for creation
+            profile_jobs.append((profile_data, template_name, server_name, deploy_value))
+        
+        # Profiles are independent of each other, so create them concurrently
+        failed_profiles = []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+            # Warm the shared lookups first so the workers don't all fetch them at once
+            if profile_jobs:
+                concurrent.futures.wait([
+                    executor.submit(lookup, api_client)
+                    for lookup in (get_organization_moid_map, get_server_profile_templates, get_managed_servers)
+                ])
+            
+            future_to_profile = {
+                executor.submit(create_server_profile, api_client, *job): job[0]['Profile Name']
+                for job in profile_jobs
+            }
+            for future in concurrent.futures.as_completed(future_to_profile):
+                profile_name = future_to_profile[future]
+                try:
+                    if not future.result():
+                        failed_profiles.append(profile_name)
+                except Exception as e:
+                    print_error(f"Error creating profile {profile_name}: {str(e)}")
+                    failed_profiles.append(profile_name)
             
         # Print summary
         print(f"\nProfile Creation Summary:")
         print(f"  Total profiles in Excel: {total_profiles}")
         print(f"  Profiles marked for deployment: {deploy_profiles}")
         print(f"  Profiles attempted: {deploy_profiles}")
+        print(f"  Profiles failed: {len(failed_profiles)}")
         
         # Print a message if any profiles need to be created manually
-        if 'profiles_for_manual_creation' in globals() and profiles_for_manual_creation:
+        if profiles_for_manual_creation:
             print("\n" + "=" * 80)
             print("\n⚠️  PROFILES REQUIRING MANUAL CREATION IN INTERSIGHT  ⚠️\n")
             print("The following profiles must be created manually in the Intersight UI")
@@ -1932,13 +2147,13 @@ def process_foundation_template(excel_file):
             
             # Create or verify each pool with progress bar
             print_info("\nProcessing pools...")
-            for _, row in progress_bar(pools_df.iterrows(), desc="Creating Pools", total=len(pools_df)):
+            pools_bar = progress_bar(pools_df.iterrows(), desc="Creating Pools", total=len(pools_df))
+            for _, row in pools_bar:
                 pool_name = row['Pool Name']
                 pool_type = row['Pool Type']
                 
-                # Update progress bar description
-                sys.stdout.write(f"\rProcessing {pool_name}...")
-                sys.stdout.flush()
+                # Show the current pool on the next progress bar refresh
+                pools_bar.set_postfix_str(pool_name, refresh=False)
                 
                 # Check if pool exists
                 if pool_exists(api_client, pool_type, pool_name):
@@ -1992,27 +2207,33 @@ def process_foundation_template(excel_file):
                     continue
                     
                 print_info(f"\nCreating {policy_type} policies...")
-                for _, row in progress_bar(policy_rows.iterrows(), desc=f"Creating {policy_type} Policies", total=len(policy_rows)):
-                    policy_name = row['Policy Name']
-                    
-                    # Update progress bar description
-                    sys.stdout.write(f"\rProcessing {policy_name}...")
-                    sys.stdout.flush()
-                    
-                    # Check if policy exists
-                    if policy_exists(api_client, get_policy_class_id(policy_type), policy_name):
-                        print(f"✅ DUPLICATE AVOIDED: Policy {policy_name} already exists in Intersight")
-                        print(f"Skipping creation to prevent duplicates")
-                        successful_policies.append(f"{policy_name} (already exists)")
-                        continue
+                # Policies of one type don't depend on each other, so create them concurrently;
+                # types still run in order because vNIC policies reference the QoS policy
+                with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+                    future_to_name = {
+                        executor.submit(ensure_policy, api_client, policy_type, row['Policy Name'], row): row['Policy Name']
+                        for _, row in policy_rows.iterrows()
+                    }
+                    policies_bar = progress_bar(concurrent.futures.as_completed(future_to_name),
+                                                desc=f"Creating {policy_type} Policies", total=len(future_to_name))
+                    for future in policies_bar:
+                        policy_name = future_to_name[future]
+                        policies_bar.set_postfix_str(policy_name, refresh=False)
+                        try:
+                            status = future.result()
+                        except Exception as e:
+                            print_error(f"Error creating policy {policy_name}: {str(e)}")
+                            status = 'failed'
                         
-                    # Try to create the policy
-                    if create_policy(api_client, row):
-                        successful_policies.append(f"{policy_type}: {policy_name}")
-                    else:
-                        failed_policies.append(f"{policy_type}: {policy_name}")
-                        print_error(f"Failed to create policy {policy_name}")
-                        break  # Stop processing this policy type if one fails
+                        if status == 'exists':
+                            print(f"✅ DUPLICATE AVOIDED: Policy {policy_name} already exists in Intersight")
+                            print(f"Skipping creation to prevent duplicates")
+                            successful_policies.append(f"{policy_name} (already exists)")
+                        elif status == 'created':
+                            successful_policies.append(f"{policy_type}: {policy_name}")
+                        else:
+                            failed_policies.append(f"{policy_type}: {policy_name}")
+                            print_error(f"Failed to create policy {policy_name}")
                 
                 # If any policies failed in this batch, stop processing
                 if failed_policies:
@@ -2099,7 +2320,7 @@ def process_foundation_template(excel_file):
                 print("\nAll server profiles created or verified successfully.")
             
         # Display a summary of profiles that need manual creation
-        if 'profiles_for_manual_creation' in globals() and profiles_for_manual_creation:
+        if profiles_for_manual_creation:
             print("\n" + "="*80)
             print("\n⚠️  PROFILES REQUIRING MANUAL CREATION IN INTERSIGHT  ⚠️")
             print("\nThe following profiles must be created manually in the Intersight UI")
@@ -2133,7 +2354,6 @@ def process_foundation_template(excel_file):
         
     except Exception as e:
         print(f"\nError processing Foundation template: {str(e)}")
-        import traceback
         traceback.print_exc()
         return False
 
@@ -2142,8 +2362,9 @@ def create_and_push_configuration(api_client, excel_file):
     Read the Excel template and create pools and policies in Intersight
     """
     try:
-        # Read Excel file
-        df = pd.read_excel(excel_file, sheet_name=None)
+        # Read only the Pools and Policies sheets from the Excel file
+        with pd.ExcelFile(excel_file) as excel:
+            df = {name: excel.parse(name) for name in ('Pools', 'Policies') if name in excel.sheet_names}
         
         # Process Pools sheet
         if 'Pools' in df:
@@ -2160,11 +2381,17 @@ def create_and_push_configuration(api_client, excel_file):
             
             for policy_type in policy_order:
                 policy_rows = policies_df[policies_df['Policy Type'] == policy_type]
-                for _, row in policy_rows.iterrows():
-                    if policy_exists(api_client, get_policy_class_id(policy_type), row['Name']):
-                        print(f"Policy {row['Name']} already exists, skipping creation")
-                    else:
-                        create_policy(api_client, row)
+                with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_API_WORKERS) as executor:
+                    future_to_name = {
+                        executor.submit(ensure_policy, api_client, policy_type, row['Name'], row): row['Name']
+                        for _, row in policy_rows.iterrows()
+                    }
+                    for future in concurrent.futures.as_completed(future_to_name):
+                        try:
+                            if future.result() == 'exists':
+                                print(f"Policy {future_to_name[future]} already exists, skipping creation")
+                        except Exception as e:
+                            print(f"Error creating policy {future_to_name[future]}: {str(e)}")
                     
         print("Completed processing the Foundation template")
         return True
@@ -2190,12 +2417,9 @@ def add_template_sheet(excel_file, api_client):
         # Load workbook
         workbook = load_workbook(excel_file)
         
-        # Store existing values if sheet exists
-        existing_values = []
+        # Drop the existing sheet; its values are rebuilt below
         if 'Template' in workbook.sheetnames:
-            template_sheet = workbook['Template']
-            existing_values = list(template_sheet.iter_rows(min_row=2, values_only=True))
-            workbook.remove(template_sheet)
+            workbook.remove(workbook['Template'])
         
         # Create new sheet
         template_sheet = workbook.create_sheet(title='Template')
@@ -2211,86 +2435,76 @@ def add_template_sheet(excel_file, api_client):
             "LAN Connectivity Policy*",
             "Storage Policy*"
         ]
-        
-        # Define styles
-        header_fill = PatternFill(start_color='1F497D', end_color='1F497D', fill_type='solid')
         return True
         
     except Exception as e:
         print(f"Error adding template sheet: {str(e)}")
         return False
         
+def _example_profiles(count=8):
+    """Sample Profiles rows for the template, one per AI POD host, with Deploy set to No"""
+    return [
+        (f'AI-Server-{i:02d}', 'AI POD Host Profile', 'default', 'AI POD Servers', 'Ai_POD_Template', '', f'Production AI POD Host {i}', 'No')
+        for i in range(1, count + 1)
+    ]
+
+def write_template_sheet(workbook, title, headers, rows, validations=()):
+    """Stream one sheet of the template workbook: widths, styled header, rows, then dropdowns"""
+    sheet = workbook.create_sheet(title)
+    
+    # Column widths must be set before the first row is streamed out
+    if headers:
+        max_lengths = [len(str(header)) for header in headers]
+        for row in rows:
+            for idx, value in enumerate(row):
+                if value and len(str(value)) > max_lengths[idx]:
+                    max_lengths[idx] = len(str(value))
+        for col, max_length in enumerate(max_lengths, 1):
+            sheet.column_dimensions[get_column_letter(col)].width = max(max_length + 2, 15)
+        
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, value=header)
+            cell.style = HEADER_STYLE
+            header_cells.append(cell)
+        sheet.append(header_cells)
+    
+    for row in rows:
+        sheet.append(row)
+    
+    # Validations are written with the sheet tail, so they can be attached last
+    for validation, cell_range in validations:
+        validation.add(cell_range)
+        sheet.data_validations.append(validation)
+    
+    return sheet
+
 def create_template_excel(excel_file):
     """Create a fresh template Excel file with the original structure"""
     # The file existence check is now handled in the main script
     # This function will always create/overwrite the specified file
-            
-    workbook = Workbook()
-    
-    # Remove default sheet
-    default = workbook.active
-    workbook.remove(default)
-    
-    # Create sheets in the correct order
-    sheets = [
-        'Pools',
-        'Policies',
-        'Template',
-        'Profiles',
-        'Templates',  # Info sheet
-        'Organizations',  # Info sheet
-        'Servers'  # Info sheet
-    ]
+    
+    # Stream every sheet straight to disk instead of keeping all cells in memory
+    workbook = Workbook(write_only=True)
     
     # Create sample lists for dropdowns - these will be populated from Intersight when the automation runs
     org_list = ["default", "DevOps", "Production", "Test", "UAT"]
     server_list = ["Server-1 (FCH1234V5Z7)", "Server-2 (FCH5678A9BC)", "Server-3 (FCH9012D3EF)"]
+    org_formula = f'"{",".join(org_list)}"'
     
-    # Create all sheets first
-    for sheet_name in sheets:
-        workbook.create_sheet(sheet_name)
-    
-    # Define styles - using a lighter shade of green for a more subtle look
-    header_fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')  # Light green
-    header_font = Font(color='000000', bold=True)  # Black text for readability
-    
-    # Set up Pools sheet
-    pools_sheet = workbook['Pools']
-    headers = ["Pool Type*", "Pool Name*", "Description", "Start Address*", "Size*"]
-    
-    for col, header in enumerate(headers, 1):
-        # Apply the header styling
-        cell = pools_sheet.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        # All headers should be black, even those with asterisks
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Add sample pool data
+    # Set up Pools sheet with sample pool data
     sample_pools = [
         ("MAC Pool", "Ai_POD-MAC-A", "MAC Pool for AI POD Fabric A", "00:25:B5:A0:00:00", "256"),
         ("MAC Pool", "Ai_POD-MAC-B", "MAC Pool for AI POD Fabric B", "00:25:B5:B0:00:00", "256"),
         ("UUID Pool", "Ai_POD-UUID-Pool", "UUID Pool for AI POD Servers", "0000-000000000001", "100")
     ]
+    write_template_sheet(
+        workbook, 'Pools',
+        ["Pool Type*", "Pool Name*", "Description", "Start Address*", "Size*"],
+        sample_pools
+    )
     
-    # Add all sample pool data to the sheet
-    for idx, example in enumerate(sample_pools, 2):
-        for col, value in enumerate(example, 1):
-            pools_sheet.cell(row=idx, column=col, value=value)
-    
-    # Set up Policies sheet
-    policies_sheet = workbook['Policies']
-    policies_headers = ["Policy Type*", "Policy Name*", "Description", "Organization*"]
-    
-    for col, header in enumerate(policies_headers, 1):
-        # Apply the header styling
-        cell = policies_sheet.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        # All headers should be black, even those with asterisks
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Add sample policy data
+    # Set up Policies sheet with sample policy data and organization dropdown in column D
     sample_policies = [
         ('vNIC', 'Ai_POD-vNIC-A', 'vNIC Policy for AI POD Fabric A', 'default'),
         ('vNIC', 'Ai_POD-vNIC-B', 'vNIC Policy for AI POD Fabric B', 'default'),
@@ -2299,17 +2513,16 @@ def create_template_excel(excel_file):
         ('QoS', 'Ai_POD-QoS', 'QoS Policy for AI POD', 'default'),
         ('Storage', 'Ai_POD-Storage', 'Storage Policy for AI POD', 'default')
     ]
-    for row_idx, row in enumerate(sample_policies, 2):
-        for col_idx, value in enumerate(row, 1):
-            policies_sheet.cell(row=row_idx, column=col_idx, value=value)
-            
-    # Add organization dropdown to column D in Policies sheet
-    org_validation_policies = DataValidation(type='list', formula1='"default,DevOps,Production,Test,UAT"', allow_blank=True)
-    policies_sheet.add_data_validation(org_validation_policies)
-    org_validation_policies.add('D2:D1000')  # Column D
+    write_template_sheet(
+        workbook, 'Policies',
+        ["Policy Type*", "Policy Name*", "Description", "Organization*"],
+        sample_policies,
+        validations=[
+            (DataValidation(type='list', formula1=org_formula, allow_blank=True), 'D2:D1000')
+        ]
+    )
     
-    # Set up Template sheet - use the existing sheet
-    template_sheet = workbook['Template']
+    # Set up Template sheet with a sample template
     template_headers = [
         "Template Name*", 
         "Organization*", 
@@ -2321,19 +2534,6 @@ def create_template_excel(excel_file):
         "LAN Connectivity Policy*",
         "Storage Policy*"
     ]
-    for col, header in enumerate(template_headers, 1):
-        # Split header for asterisk
-        if header.endswith('*'):
-            base = header.rstrip('*')
-            cell = template_sheet.cell(row=1, column=col, value=base + '*')
-        else:
-            cell = template_sheet.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        # All headers should be black, even those with asterisks
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Add sample template data
     template_example = [
         "Ai_POD_Template",
         "default",
@@ -2345,121 +2545,48 @@ def create_template_excel(excel_file):
         "Ai_POD-vNIC-A",
         "Ai_POD-Storage"
     ]
-    for col, value in enumerate(template_example, 1):
-        template_sheet.cell(row=2, column=col, value=value)
-        
-    # Add organization dropdown to column B in Template sheet
-    org_validation_template = DataValidation(type='list', formula1='"default,DevOps,Production,Test,UAT"', allow_blank=True)
-    template_sheet.add_data_validation(org_validation_template)
-    org_validation_template.add('B2:B1000')  # Column B
-    
-    # Add target platform dropdown to column E in Template sheet (correct column for Target Platform)
-    platform_validation = DataValidation(type='list', formula1='"FIAttached,Standalone"', allow_blank=True)
-    template_sheet.add_data_validation(platform_validation)
-    platform_validation.add('E2:E1000')  # Column E (Target Platform)
+    write_template_sheet(
+        workbook, 'Template', template_headers, [template_example],
+        validations=[
+            # Organization in column B, Target Platform in column E
+            (DataValidation(type='list', formula1=org_formula, allow_blank=True), 'B2:B1000'),
+            (DataValidation(type='list', formula1='"FIAttached,Standalone"', allow_blank=True), 'E2:E1000')
+        ]
+    )
     
-    # Set up Profiles sheet - use the existing sheet
-    profiles_sheet = workbook['Profiles']
+    # Set up Profiles sheet with 8 sample profiles, Deploy set to No
     profile_headers = ["Profile Name*", "Description", "Organization*", "Resource Group*", "Template Name*", "Server*", "Description", "Deploy*"]
-    for col, header in enumerate(profile_headers, 1):
-        cell = profiles_sheet.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = Font(bold=True, color='000000')  # Always black and bold
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Add 8 sample profile templates with Deploy set to No
-    for i in range(1, 9):
-        profiles_sheet.append([f'AI-Server-{i:02d}', 'AI POD Host Profile', 'default', 'AI POD Servers', 'Ai_POD_Template', '', f'Production AI POD Host {i}', 'No'])
-    print(f"Added 8 profile templates to the Profiles sheet")
-    
-    # Add data validation for Deploy column
-    deploy_validation = DataValidation(type='list', formula1='"Yes,No"', allow_blank=True)
-    profiles_sheet.add_data_validation(deploy_validation)
-    deploy_validation.add('H2:H1000')  # Column H - Deploy column
-    
-    # Add organization dropdown to column C in Profiles sheet
-    org_validation_profiles = DataValidation(type='list', formula1='"default,DevOps,Production,Test,UAT"', allow_blank=True)
-    profiles_sheet.add_data_validation(org_validation_profiles)
-    org_validation_profiles.add('C2:C1000')  # Column C
-    
-    # Add server dropdown (with name and serial) to column F
-    server_validation = DataValidation(type='list', formula1='"Server-1 (FCH1234V5Z7),Server-2 (FCH5678A9BC),Server-3 (FCH9012D3EF)"', allow_blank=True)
-    profiles_sheet.add_data_validation(server_validation)
-    server_validation.add('F2:F1000')  # Column F - Server column
-    
-    # Create sample organization list for dropdowns
-    org_list = ["default", "DevOps", "Production", "Test", "UAT"]
-    
-    # Create sample server list for dropdowns (with name and serial)
-    server_list = ["Server-1 (FCH1234V5Z7)", "Server-2 (FCH5678A9BC)", "Server-3 (FCH9012D3EF)"]
-    
-    # Profiles sheet: Organization in column C, Server dropdown in column F, Deploy dropdown in column H
-    org_validation_profiles = DataValidation(type='list', formula1=f'"{",".join(org_list)}"', allow_blank=True)
-    profiles_sheet.add_data_validation(org_validation_profiles)
-    org_validation_profiles.add('C2:C1000')  # Column C
-
-    server_validation = DataValidation(type='list', formula1=f'"{",".join(server_list)}"', allow_blank=True)
-    profiles_sheet.add_data_validation(server_validation)
-    server_validation.add('F2:F1000')  # Column F only
-
-    deploy_validation = DataValidation(type='list', formula1='"Yes,No"', allow_blank=True)
-    profiles_sheet.add_data_validation(deploy_validation)
-    deploy_validation.add('H2:H1000')  # Column H only
-
+    sample_profiles = _example_profiles()
     # Template name should not have a dropdown as it comes from Template sheet
+    write_template_sheet(
+        workbook, 'Profiles', profile_headers, sample_profiles,
+        validations=[
+            # Organization in column C, Server in column F, Deploy in column H
+            (DataValidation(type='list', formula1=org_formula, allow_blank=True), 'C2:C1000'),
+            (DataValidation(type='list', formula1=f'"{",".join(server_list)}"', allow_blank=True), 'F2:F1000'),
+            (DataValidation(type='list', formula1='"Yes,No"', allow_blank=True), 'H2:H1000')
+        ]
+    )
+    print(f"Added {len(sample_profiles)} profile templates to the Profiles sheet")
     
-    # Template sheet: Organization in column B
-    org_validation_template = DataValidation(type='list', formula1=f'"{",".join(org_list)}"', allow_blank=True)
-    template_sheet.add_data_validation(org_validation_template)
-    org_validation_template.add('B2:B1000')  # Column B
-    
-    # Pools sheet: No organization dropdown needed (as per requirements)
-    
-    # Set column widths for all sheets
-    for sheet in workbook.sheetnames:
-        ws = workbook[sheet]
-        for column in ws.columns:
-            max_length = max(len(str(cell.value or "")) for cell in column)
-            adjusted_width = max(max_length + 2, 15)
-            ws.column_dimensions[get_column_letter(column[0].column)].width = adjusted_width
+    # Info sheets are filled in from Intersight when the automation runs
+    write_template_sheet(workbook, 'Templates', [], [])
+    write_template_sheet(workbook, 'Organizations', [], [])
     
-    # We're keeping only the essential sheets and dropdowns
-
     # Set up Servers sheet for server inventory
-    servers_sheet = workbook['Servers']
-    server_headers = ["Server Name*", "Serial Number*", "Description", "Model"]
-    
-    # Add headers to Servers sheet
-    for col, header in enumerate(server_headers, 1):
-        cell = servers_sheet.cell(row=1, column=col, value=header)
-        cell.fill = header_fill
-        cell.font = header_font
-        if '*' in header:
-            cell.font = Font(color='000000', bold=True)
-        cell.alignment = Alignment(horizontal='center')
-    
-    # Add sample server data
     sample_servers = [
         ("C220M5-Hosting-Server1", "FCH1234V5Z7", "Hosting Server 1", "UCS C220 M5"),
         ("C220M5-Hosting-Server2", "FCH5678A9BC", "Hosting Server 2", "UCS C220 M5"),
         ("C220M5-Hosting-Server3", "FCH9012D3EF", "Hosting Server 3", "UCS C220 M5")
     ]
-    
-    # Add servers to the sheet
-    for row_idx, server in enumerate(sample_servers, 2):
-        for col_idx, value in enumerate(server, 1):
-            servers_sheet.cell(row=row_idx, column=col_idx, value=value)
-    
-    # Auto-adjust column widths for all sheets
-    for sheet in workbook.sheetnames:
-        ws = workbook[sheet]
-        for column in ws.columns:
-            max_length = max(len(str(cell.value or "")) for cell in column)
-            adjusted_width = max(max_length + 2, 15)
-            ws.column_dimensions[get_column_letter(column[0].column)].width = adjusted_width
+    write_template_sheet(
+        workbook, 'Servers',
+        ["Server Name*", "Serial Number*", "Description", "Model"],
+        sample_servers
+    )
     
     # Save the workbook
-    workbook.save(excel_file)
+    save_workbook(workbook, excel_file)
     print(f"Created template Excel file: {excel_file}")
     return True
 
@@ -2469,6 +2596,59 @@ def add_data_validation(worksheet, column, start_row, end_row, formula):
     worksheet.add_data_validation(validation)
     validation.add(f'{column}{start_row}:{column}{end_row}')
 
+def save_workbook(workbook, excel_file):
+    """Save a workbook in memory, then swap it in so the target file is never left half-written"""
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+    tmp_file = f"{excel_file}.tmp"
+    try:
+        with open(tmp_file, 'wb') as f:
+            f.write(buffer.getbuffer())
+        os.replace(tmp_file, excel_file)
+    except OSError:
+        # Don't leave the partial temp file behind (e.g. target open in Excel, disk full)
+        try:
+            os.remove(tmp_file)
+        except OSError:
+            pass
+        raise
+
+def set_list_validation(worksheet, cell_range, formula):
+    """Set a list dropdown on a range, replacing any validation already on exactly that range"""
+    worksheet.data_validations.dataValidation = [
+        dv for dv in worksheet.data_validations.dataValidation if str(dv.sqref) != cell_range
+    ]
+    validation = DataValidation(type='list', formula1=formula, allow_blank=True)
+    validation.add(cell_range)
+    worksheet.add_data_validation(validation)
+    return validation
+
+def write_lookup_list(workbook, column, header, values):
+    """Write dropdown options to the hidden _Lookups sheet and return a range formula for them"""
+    if '_Lookups' in workbook.sheetnames:
+        lookup_sheet = workbook['_Lookups']
+    else:
+        lookup_sheet = workbook.create_sheet('_Lookups')
+        lookup_sheet.sheet_state = 'hidden'
+    
+    # Clear any previous list in this column before writing the new one
+    for row in range(2, lookup_sheet.max_row + 1):
+        lookup_sheet[f'{column}{row}'].value = None
+    
+    lookup_sheet[f'{column}1'] = header
+    for row, value in enumerate(values, start=2):
+        lookup_sheet[f'{column}{row}'] = value
+    
+    last_row = max(len(values) + 1, 2)
+    return f"'_Lookups'!${column}$2:${column}${last_row}"
+
+def list_formula(workbook, column, header, values):
+    """Return an inline list formula, or a _Lookups range if the list exceeds Excel's 255 character limit"""
+    inline = '"' + ','.join(values) + '"'
+    if len(inline) - 2 <= EXCEL_LIST_FORMULA_LIMIT:
+        return inline
+    return write_lookup_list(workbook, column, header, values)
+
 def add_dependency_sheet(workbook):
     """Add a policy dependency visualization sheet to the workbook.
     
@@ -2481,32 +2661,19 @@ def add_dependency_sheet(workbook):
             # Create the sheet
             dep_sheet = workbook.create_sheet("Dependencies")
             
-            # Add headers
-            dep_sheet.cell(row=1, column=1, value="Policy/Component")
-            dep_sheet.cell(row=1, column=2, value="Depends On")
-            dep_sheet.cell(row=1, column=3, value="Relationship")
-            
-            # Format headers
-            for col in range(1, 4):
-                cell = dep_sheet.cell(row=1, column=col)
-                cell.fill = PatternFill(start_color='1F497D', end_color='1F497D', fill_type='solid')
-                cell.font = Font(color='FFFFFF', bold=True)
-            
-            # Add dependency data
-            row = 2
+            # Add and format headers
+            dep_sheet.append(["Policy/Component", "Depends On", "Relationship"])
+            for cell in dep_sheet[1]:
+                cell.style = INFO_HEADER_STYLE
+            
+            # Add dependency data, with the component name in bold; track the row
+            # number here since max_row rescans every cell on each access
+            row = dep_sheet.max_row
             for component, dependencies in POLICY_DEPENDENCIES.items():
                 for dependency in dependencies:
-                    dep_sheet.cell(row=row, column=1, value=component)
-                    dep_sheet.cell(row=row, column=2, value=dependency)
-                    dep_sheet.cell(row=row, column=3, value="Required")
-                    
-                    # Apply formatting
-                    for col in range(1, 4):
-                        cell = dep_sheet.cell(row=row, column=col)
-                        if col == 1:
-                            cell.font = Font(bold=True)
-                    
+                    dep_sheet.append([component, dependency, "Required"])
                     row += 1
+                    dep_sheet.cell(row=row, column=1).font = BOLD_FONT
             
             # Set column widths
             min_widths = {
@@ -2537,11 +2704,9 @@ def add_version_sheet(workbook, version=TEMPLATE_VERSION):
             # Create the sheet
             version_sheet = workbook.create_sheet("Version")
             # Add headers
-            headers = ["Version", "Date", "Description", "Author"]
-            for col, header in enumerate(headers, 1):
-                cell = version_sheet.cell(row=1, column=col, value=header)
-                cell.fill = PatternFill(start_color='1F497D', end_color='1F497D', fill_type='solid')
-                cell.font = Font(color='FFFFFF', bold=True)
+            version_sheet.append(["Version", "Date", "Description", "Author"])
+            for cell in version_sheet[1]:
+                cell.style = INFO_HEADER_STYLE
             
             # Set column widths
             min_widths = {
@@ -2554,62 +2719,69 @@ def add_version_sheet(workbook, version=TEMPLATE_VERSION):
             auto_adjust_column_width(version_sheet, min_width=10, padding=2, custom_width_map=min_widths)
             
             # Add first entry
-            version_sheet.cell(row=2, column=1, value=version)
-            version_sheet.cell(row=2, column=2, value=datetime.now().strftime("%Y-%m-%d"))
-            version_sheet.cell(row=2, column=3, value="Initial template creation with dynamic organization and server dropdowns")
-            version_sheet.cell(row=2, column=4, value=os.environ.get('USER', 'Intersight-Admin'))
+            version_sheet.append([
+                version,
+                datetime.now().strftime("%Y-%m-%d"),
+                "Initial template creation with dynamic organization and server dropdowns",
+                os.environ.get('USER', 'Intersight-Admin')
+            ])
         else:
             # Update existing version sheet with new entry
             version_sheet = workbook["Version"]
-            next_row = version_sheet.max_row + 1
-            version_sheet.cell(row=next_row, column=1, value=version)
-            version_sheet.cell(row=next_row, column=2, value=datetime.now().strftime("%Y-%m-%d"))
-            version_sheet.cell(row=next_row, column=3, value="Updated template with latest organizations and servers")
-            version_sheet.cell(row=next_row, column=4, value=os.environ.get('USER', 'Intersight-Admin'))
+            version_sheet.append([
+                version,
+                datetime.now().strftime("%Y-%m-%d"),
+                "Updated template with latest organizations and servers",
+                os.environ.get('USER', 'Intersight-Admin')
+            ])
         
         return True
     except Exception as e:
         print(f"Error adding version sheet: {str(e)}")
         return False
 
-def get_intersight_info(api_client, excel_file):
-    """Get information from Intersight and update the Excel file"""
+def get_intersight_info(api_client, excel_file, workbook=None, defer_save=False):
+    """
+    Get information from Intersight and update the Excel file
+    
+    Like update_profiles_with_server_info, accepts an already loaded workbook and
+    returns it unsaved when defer_save is True.
+    """
     try:
         # Load existing workbook
-        workbook = load_workbook(excel_file)
-        
-        # Correct sheet naming and order
-        sheet_renames = {
-            'Pools': 'Pools1',
-            'Policies': 'Policies1',
-            'Template': 'Template1',
-            'Profiles': 'Profiles1',
-            'Pools1': 'Pools',
-            'Policies1': 'Policies',
-            'Template1': 'Template',
-            'Profiles1': 'Profiles'
-        }
+        if workbook is None:
+            workbook = load_workbook(excel_file)
         
-        for old_name, new_name in sheet_renames.items():
-            if old_name in workbook.sheetnames:
-                workbook[old_name].title = new_name
+        # Restore standard sheet names left with a "1" suffix
+        for sheet_name in ('Pools', 'Policies', 'Template', 'Profiles'):
+            if sheet_name not in workbook.sheetnames and f"{sheet_name}1" in workbook.sheetnames:
+                workbook[f"{sheet_name}1"].title = sheet_name
         
         # DO NOT rearrange sheet order to preserve template structure
         # Just log the current sheets
+        sheet_names = set(workbook.sheetnames)
         print(f"Working with existing sheets: {', '.join(workbook.sheetnames)}")
 
+        # The organization, resource group and server reads are independent,
+        # so issue them together instead of one after another
+        with concurrent.futures.ThreadPoolExecutor(max_workers=3) as executor:
+            orgs_future = executor.submit(_get_organization_names, api_client)
+            resource_groups_future = executor.submit(resource_api.ResourceApi(api_client).get_resource_group_list)
+            servers_future = executor.submit(get_rack_units, api_client)
+
         # Get organizations
         print("\nGetting organizations from Intersight...")
-        org_api = organization_api.OrganizationApi(api_client)
-        orgs = org_api.get_organization_organization_list()
-        org_names = [org.name for org in orgs.results]
+        org_names = orgs_future.result()
         print(f"Found {len(org_names)} organizations: {org_names}")
+        
+        # Keep the organization list on the hidden lookup sheet so every
+        # organization dropdown can reference it as a range
+        org_formula = write_lookup_list(workbook, 'B', 'Organizations', org_names)
 
         # Get resource groups
         print("\nGetting resource groups from Intersight...")
         try:
-            resource_api_instance = resource_api.ResourceApi(api_client)
-            resource_groups = resource_api_instance.get_resource_group_list()
+            resource_groups = resource_groups_future.result()
             # Filter out License-related resource groups and other system groups that aren't user-relevant
             raw_resource_group_names = [group.name for group in resource_groups.results]
             resource_group_names = []
@@ -2636,13 +2808,12 @@ def get_intersight_info(api_client, excel_file):
 
         # Get servers
         print("\nGetting servers from Intersight...")
-        compute_api_instance = compute_api.ComputeApi(api_client)
-        servers = compute_api_instance.get_compute_rack_unit_list()
-        server_names = [server.name for server in servers.results]
+        servers = servers_future.result()
+        server_names = [server['name'] for server in servers]
         print(f"Found {len(server_names)} servers: {server_names}")
         
         # Populate Servers sheet
-        if 'Servers' in workbook.sheetnames:
+        if 'Servers' in sheet_names:
             servers_sheet = workbook['Servers']
             
             # Find the header row
@@ -2653,93 +2824,30 @@ def get_intersight_info(api_client, excel_file):
                     break
             
             # Clear existing data but only below the header row
-            for row in range(header_row + 1, servers_sheet.max_row + 1):
-                for col in range(1, 5):
-                    servers_sheet.cell(row=row, column=col).value = None
-            
-            # Add actual server data starting right after the header row
-            row = header_row + 1
-            for i, server_name in enumerate(server_names):
-                servers_sheet.cell(row=row, column=1, value=server_name)
-                try:
-                    server_filter = f"Name eq '{server_name}'"
-                    server_details = compute_api_instance.get_compute_rack_unit_list(filter=server_filter)
-                    if server_details.results and len(server_details.results) > 0:
-                        server = server_details.results[0]
-                        servers_sheet.cell(row=row, column=2, value=server.serial)
-                        servers_sheet.cell(row=row, column=3, value=f"Intersight managed server")
-                        servers_sheet.cell(row=row, column=4, value=server.model)
-                    else:
-                        servers_sheet.cell(row=row, column=2, value=f"FCH{(i+1)*12345:07d}")
-                        servers_sheet.cell(row=row, column=3, value=f"Intersight managed server {i+1}")
-                        model = "UCS C-Series"
-                        if "C220M5" in server_name:
-                            model = "UCS C220 M5"
-                        elif "C220M4" in server_name:
-                            model = "UCS C220 M4"
-                        elif "C480ML" in server_name:
-                            model = "UCS C480 ML M5"
-                        servers_sheet.cell(row=row, column=4, value=model)
-                except Exception as e:
-                    print(f"  - Warning: Could not get detailed info for server {server_name}: {str(e)}")
-                    servers_sheet.cell(row=row, column=2, value=f"FCH{(i+1)*12345:07d}")
-                    servers_sheet.cell(row=row, column=3, value=f"Intersight managed server {i+1}")
-                    servers_sheet.cell(row=row, column=4, value="UCS C-Series")
-                row += 1
+            if servers_sheet.max_row > header_row:
+                servers_sheet.delete_rows(header_row + 1, servers_sheet.max_row - header_row)
+            
+            # Add actual server data starting right after the header row.
+            # The rack unit list above already carries serial and model, so
+            # no per-server lookup is needed.
+            for server in servers:
+                servers_sheet.append([server['name'], server['serial'], "Intersight managed server", server['model']])
         
             # Reapply header formatting
-            from openpyxl.styles import PatternFill, Font, Alignment
-            header_fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')
             for col in range(1, 5):
-                cell = servers_sheet.cell(row=header_row, column=col)
-                cell.font = Font(bold=True, color='FF000000')
-                cell.fill = header_fill
-                cell.alignment = Alignment(horizontal='center')
+                servers_sheet.cell(row=header_row, column=col).style = HEADER_STYLE
         
         # Set up Profiles sheet dropdowns
-        if 'Profiles' in workbook.sheetnames:
+        if 'Profiles' in sheet_names:
             profiles_sheet = workbook['Profiles']
             
             # Ensure header row formatting is correct
-            # Define styles - using a lighter shade of green for a more subtle look
-            header_fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')  # Light green
-            header_font = Font(color='FF000000', bold=True)  # Black text for readability
-            
-            # Re-apply formatting to headers
             for col in range(1, profiles_sheet.max_column + 1):
-                cell = profiles_sheet.cell(row=1, column=col)
-                cell.fill = header_fill
-                cell.font = header_font
-            
-            # Clear all validations
-            profiles_sheet.data_validations.dataValidation = []
-            
-            # Re-add existing non-org validations
-            existing_dv = []
-            org_dv_found = False
-            
-            for dv in list(profiles_sheet.data_validations.dataValidation):
-                # Check if this is an organization dropdown
-                is_org_dv = False
-                for cell_range in dv.sqref:
-                    if str(cell_range).startswith('C'):
-                        # This is the org dropdown, update it
-                        dv.formula1 = f'"{",".join(org_names)}"'
-                        org_dv_found = True
-                        is_org_dv = True
-                        break
-                
-                # Keep all non-org dropdowns
-                if not is_org_dv:
-                    existing_dv.append(dv)
+                profiles_sheet.cell(row=1, column=col).style = HEADER_STYLE
             
-            # Clear and re-add all validations
+            # Clear all validations; every Profiles dropdown is rebuilt below
             profiles_sheet.data_validations.dataValidation = []
             
-            # Re-add existing non-org validations
-            for dv in existing_dv:
-                profiles_sheet.add_data_validation(dv)
-            
             # Find column indexes by header name
             header_map = {profiles_sheet.cell(row=1, column=col).value: col for col in range(1, profiles_sheet.max_column + 1)}
             server_col = header_map.get('Server*')
@@ -2749,7 +2857,7 @@ def get_intersight_info(api_client, excel_file):
             template_name_col = header_map.get('Template Name*')
             
             # Create a simple static approach instead of dynamic dropdowns to avoid Excel compatibility issues
-            if server_col and len(servers.results) > 0:
+            if server_col and len(servers) > 0:
                 print("Creating static server dropdown with resource group information")
                 
                 # Map servers to resource groups based on name patterns for documentation
@@ -2760,20 +2868,20 @@ def get_intersight_info(api_client, excel_file):
                 # Collect all server options in a single list
                 all_server_options = []
                 
-                for server in servers.results:
-                    server_option = f"{server.name} | SN: {server.serial}"
+                for server in servers:
+                    server_option = f"{server['name']} | SN: {server['serial']}"
                     all_server_options.append(server_option)
                     
                     # Also track which resource group each server belongs to
-                    if "Worker" in server.name and "AI-Pod-Worker-Nodes" in resource_group_names:
+                    if "Worker" in server['name'] and "AI-Pod-Worker-Nodes" in resource_group_names:
                         server_resource_groups["AI-Pod-Worker-Nodes"].append(server_option)
-                    elif "CP" in server.name and "AI-Pod-Cluster-Nodes" in resource_group_names:
+                    elif "CP" in server['name'] and "AI-Pod-Cluster-Nodes" in resource_group_names:
                         server_resource_groups["AI-Pod-Cluster-Nodes"].append(server_option)
-                    elif "RAG" in server.name and "AI_Pod_RAG" in resource_group_names:
+                    elif "RAG" in server['name'] and "AI_Pod_RAG" in resource_group_names:
                         server_resource_groups["AI_Pod_RAG"].append(server_option)
-                    elif "AI" in server.name and "AIIntersight" in resource_group_names:
+                    elif "AI" in server['name'] and "AIIntersight" in resource_group_names:
                         server_resource_groups["AIIntersight"].append(server_option)
-                    elif "Isaiah" in server.name and "Isaiah_automation" in resource_group_names:
+                    elif "Isaiah" in server['name'] and "Isaiah_automation" in resource_group_names:
                         server_resource_groups["Isaiah_automation"].append(server_option)
                     elif "AI POD Servers" in resource_group_names:
                         server_resource_groups["AI POD Servers"].append(server_option)
@@ -2784,15 +2892,10 @@ def get_intersight_info(api_client, excel_file):
                     if servers_list:
                         print(f"  - {rg_name}: {len(servers_list)} servers")
                 
-                # Create a simple static dropdown with all servers
-                # First remove any existing validation in the server column
-                for dv in list(profiles_sheet.data_validations.dataValidation):
-                    if f"{get_column_letter(server_col)}2" in str(dv.sqref):
-                        profiles_sheet.data_validations.dataValidation.remove(dv)
-                
-                # Create a static dropdown with all servers
-                visible_servers = all_server_options[:50] if len(all_server_options) > 50 else all_server_options
-                server_formula = '"' + ','.join(visible_servers) + '"'
+                # Create a dropdown with all servers (Profiles validations were
+                # cleared above). Point it at the hidden lookup list so it is not
+                # bound by Excel's 255 character limit on literal lists
+                server_formula = write_lookup_list(workbook, 'A', 'Servers', all_server_options)
                 server_dv = DataValidation(type='list', formula1=server_formula, allow_blank=True)
                 server_dv.add(f"{get_column_letter(server_col)}2:{get_column_letter(server_col)}1000")
                 profiles_sheet.add_data_validation(server_dv)
@@ -2806,32 +2909,24 @@ def get_intersight_info(api_client, excel_file):
                 mapping_sheet = workbook['ServerMapping']
                 
                 # Clear existing content
-                for row in range(1, mapping_sheet.max_row + 1):
-                    for col in range(1, mapping_sheet.max_column + 1):
-                        mapping_sheet.cell(row=row, column=col).value = None
+                mapping_sheet.delete_rows(1, mapping_sheet.max_row)
                 
                 # Add header and instructions
-                mapping_sheet.cell(row=1, column=1).value = "Resource Group to Server Mapping"
-                mapping_sheet.cell(row=2, column=1).value = "Use this sheet to find which servers belong to each resource group"
-                mapping_sheet.cell(row=3, column=1).value = "Resource Group"
-                mapping_sheet.cell(row=3, column=2).value = "Servers"
+                mapping_sheet.append(["Resource Group to Server Mapping"])
+                mapping_sheet.append(["Use this sheet to find which servers belong to each resource group"])
+                mapping_sheet.append(["Resource Group", "Servers"])
                 
                 # Add mapping data
-                row_index = 4
                 for rg_name, servers_list in server_resource_groups.items():
                     if not servers_list:
                         continue
                     
-                    mapping_sheet.cell(row=row_index, column=1).value = rg_name
-                    
                     # Add each server as a separate row for better readability
-                    for i, server in enumerate(servers_list):
-                        if i == 0:
-                            mapping_sheet.cell(row=row_index, column=2).value = server
-                        else:
-                            mapping_sheet.cell(row=row_index + i, column=2).value = server
+                    mapping_sheet.append([rg_name, servers_list[0]])
+                    for server in servers_list[1:]:
+                        mapping_sheet.append([None, server])
                     
-                    row_index += max(len(servers_list), 1) + 1  # Add empty row between groups
+                    mapping_sheet.append([])  # Add empty row between groups
                 
                 # Add a note to the Server column to help users know about the mapping sheet
                 note_cell = profiles_sheet.cell(row=1, column=server_col)
@@ -2858,7 +2953,6 @@ def get_intersight_info(api_client, excel_file):
             # Add organization dropdown to correct column
             if org_col:
                 print(f"Updating organization dropdown options with values: {org_names}")
-                org_formula = f'"{",".join(org_names)}"'
                 print(f"Organization formula: {org_formula}")
                 org_validation = DataValidation(
                     type='list',
@@ -2871,7 +2965,7 @@ def get_intersight_info(api_client, excel_file):
             
             # Add resource group dropdown to correct column
             if resource_group_col:
-                resource_group_formula = '"' + ','.join(resource_group_names) + '"'
+                resource_group_formula = list_formula(workbook, 'C', 'Resource Groups', resource_group_names)
                 resource_group_validation = DataValidation(
                     type='list',
                     formula1=resource_group_formula,
@@ -2885,14 +2979,14 @@ def get_intersight_info(api_client, excel_file):
             if template_name_col:
                 # Gather template names from the Template sheet if available
                 template_names = []
-                if 'Template' in workbook.sheetnames:
+                if 'Template' in sheet_names:
                     template_sheet = workbook['Template']
                     for row in range(2, template_sheet.max_row + 1):
                         name = template_sheet.cell(row=row, column=1).value
                         if name:
                             template_names.append(str(name))
                 if template_names:
-                    template_name_formula = '"' + ','.join(template_names) + '"'
+                    template_name_formula = list_formula(workbook, 'D', 'Templates', template_names)
                     template_name_validation = DataValidation(
                         type='list',
                         formula1=template_name_formula,
@@ -2906,87 +3000,419 @@ def get_intersight_info(api_client, excel_file):
         
         # Set up dropdowns for all sheets
         # Pools sheet dropdown
-        if 'Pools' in workbook.sheetnames:
+        if 'Pools' in sheet_names:
             pools_sheet = workbook['Pools']
             pool_types = ['MAC Pool', 'UUID Pool']
-            pool_validation = DataValidation(
-                type='list',
-                formula1=f'"{",".join(pool_types)}"',
-                allow_blank=True
-            )
-            pool_validation.add('A2:A1000')  # Apply to Pool Types column
-            pools_sheet.add_data_validation(pool_validation)
+            set_list_validation(pools_sheet, 'A2:A1000', f'"{",".join(pool_types)}"')  # Apply to Pool Types column
             print("Added dropdown for Pool Types in Pools sheet")
 
         # Policies sheet dropdown
-        if 'Policies' in workbook.sheetnames:
+        if 'Policies' in sheet_names:
             policies_sheet = workbook['Policies']
             
             # Always create fresh organization dropdown
             print(f"Updating organization dropdown for Policies sheet with values: {org_names}")
-            org_formula = f'"{",".join(org_names)}"'
-            org_validation = DataValidation(
-                type='list',
-                formula1=org_formula,
-                allow_blank=True
-            )
-            org_validation.add('D2:D1000')  # Apply to Organizations columns
-            policies_sheet.add_data_validation(org_validation)
+            set_list_validation(policies_sheet, 'D2:D1000', org_formula)  # Apply to Organizations columns
             
             print("Added/Updated dropdowns for Policy Types and Organizations in Policies sheet")
         
         # Template sheet dropdowns
-        if 'Template' in workbook.sheetnames:
+        if 'Template' in sheet_names:
             template_sheet = workbook['Template']
             
             # Always create fresh organization dropdown
             print(f"Updating organization dropdown for Template sheet with values: {org_names}")
-            org_formula = f'"{",".join(org_names)}"'
-            org_validation = DataValidation(
-                type='list',
-                formula1=org_formula,
-                allow_blank=True
-            )
-            org_validation.add('B2:B1000')  # Apply to Organizations column
-            template_sheet.add_data_validation(org_validation)
+            set_list_validation(template_sheet, 'B2:B1000', org_formula)  # Apply to Organizations column
             
             print("Added/Updated dropdowns for Platform Types and Organizations in Template sheet")
         
         # Skip auto-adjusting column widths to preserve template formatting
         print("\nPreserving column widths to maintain template formatting...")
         
+        if defer_save:
+            return workbook
+        
         # Save workbook
         print("\nSaving Excel file...")
-        workbook.save(excel_file)
+        save_workbook(workbook, excel_file)
         print("Excel file has been set up with correct sheet order and structure")
         return True
     except Exception as e:
         print(f"Error setting up Excel file: {str(e)}")
-        import traceback
         traceback.print_exc()
         return False
 
+def clear_moid_caches():
+    """Forget cached organization, policy and pool MOIDs, e.g. after objects are renamed or deleted"""
+    _ORG_MOID_CACHE.clear()
+    _MOID_CACHE.clear()
+    _PREFETCHED_TYPES.clear()
+    _VNIC_NAME_CACHE.clear()
+
 def get_org_moid(api_client, org_name="Gruve"):  # Set default to Gruve
     """
     Get the MOID (Managed Object ID) for an organization by name
     """
-    from intersight.api import organization_api
+    key = (id(api_client), org_name)
+    if key in _ORG_MOID_CACHE:
+        return _ORG_MOID_CACHE[key]
     
     try:
-        # Create Organization API instance
-        api_instance = organization_api.OrganizationApi(api_client)
+        # Get Organization API instance
+        api_instance = get_organization_api(api_client)
         
         # Get list of organizations
         orgs = api_instance.get_organization_organization_list(filter=f"Name eq '{org_name}'")
         
         if orgs.results and len(orgs.results) > 0:
-            return orgs.results[0].moid
+            _ORG_MOID_CACHE[key] = orgs.results[0].moid
+            return _ORG_MOID_CACHE[key]
         else:
             raise Exception(f"Organization '{org_name}' not found")
             
     except Exception as e:
         raise Exception(f"Error getting organization MOID: {str(e)}")
 
+@contextlib.contextmanager
+def create_rate_limit():
+    """
+    Hold one of MAX_CONCURRENT_CREATES slots and space create requests at least
+    1 / CREATE_RATE_PER_SECOND seconds apart for the duration of the block.
+    
+    Intersight answers a burst of policy creates with 400s while the related
+    objects are still in "Validating" state, and those are not worth retrying.
+    """
+    global _next_create_at
+    with _CREATE_SEMAPHORE:
+        with _CREATE_RATE_LOCK:
+            now = time.monotonic()
+            wait = _next_create_at - now
+            _next_create_at = max(now, _next_create_at) + 1.0 / CREATE_RATE_PER_SECOND
+        if wait > 0:
+            time.sleep(wait)
+        yield
+
+def _create_bios_policy(api_client, policy_name, policy_data, org_ref):
+    """Create a BIOS policy with performance settings"""
+    api_instance = bios_api.BiosApi(api_client)
+
+    # Create BIOS policy with performance settings
+    policy = BiosPolicy(
+        class_id="bios.Policy",
+        object_type="bios.Policy",
+        name=policy_name,
+        organization=org_ref,
+        cpu_performance="enterprise",
+        cpu_power_management="performance",
+        cpu_energy_performance="performance",
+        intel_virtualization_technology="enabled"
+    )
+
+    with create_rate_limit():
+        result = api_instance.create_bios_policy(policy)
+    logger.info("Successfully created BIOS Policy: %s", result.name)
+    return True
+
+def _create_qos_policy(api_client, policy_name, policy_data, org_ref):
+    """Create a vNIC Ethernet QoS policy"""
+    api_instance = vnic_api.VnicApi(api_client)
+
+    # Create QoS policy
+    qos = {
+        "name": policy_name,
+        "organization": org_ref,
+        "mtu": 9000,
+        "rate_limit": 0,
+        "cos": 5,
+        "burst": 1024,
+        "priority": "Best Effort",
+        "class_id": "vnic.EthQosPolicy",
+        "object_type": "vnic.EthQosPolicy"
+    }
+
+    with create_rate_limit():
+        result = api_instance.create_vnic_eth_qos_policy(qos)
+    logger.info("Successfully created QoS Policy: %s", result.name)
+    return True
+
+def bulk_create(api_client, items):
+    """
+    Create several objects with a single Intersight bulk request.
+    
+    items is a list of (resource path, SDK model class, body dict or model of that
+    class); the created objects come back in the same order as namespaces with
+    name and moid.
+    The SDK's bulk models cannot hold arbitrary object bodies, so the request
+    is posted directly with each body converted through its own model class.
+    """
+    sub_requests = []
+    for uri, model_class, body in items:
+        model = validate_and_convert_types(body, (model_class,), ['body'], False, True, api_client.configuration)
+        sub_requests.append({
+            "ObjectType": "bulk.RestSubRequest",
+            "Verb": "POST",
+            "Uri": f"/v1{uri}",
+            "Body": api_client.sanitize_for_serialization(model)
+        })
+    
+    header_params = {
+        'Accept': api_client.select_header_accept(['application/json']),
+        'Content-Type': api_client.select_header_content_type(['application/json'])
+    }
+    with create_rate_limit():
+        response = api_client.call_api(
+            '/api/v1/bulk/Requests', 'POST',
+            header_params=header_params,
+            body={"ObjectType": "bulk.Request", "ActionOnError": "Stop", "Requests": sub_requests},
+            auth_settings=['cookieAuth', 'http_signature', 'oAuth2'],
+            _return_http_data_only=True,
+            _preload_content=False)
+    results = json_loads(response.data).get("Results", [])
+    
+    created = []
+    for (uri, _, body), result in zip(items, results):
+        if result.get("Status", 0) >= 400:
+            raise Exception(f"Bulk create of {body.get('name')} at {uri} failed: {result.get('Body')}")
+        created.append(types.SimpleNamespace(name=result["Body"].get("Name"), moid=result["Body"].get("Moid")))
+    if len(created) != len(items):
+        raise Exception(f"Bulk request returned {len(created)} of {len(items)} results")
+    return created
+
+def moref(object_type, moid):
+    """Build an mo.MoRef body pointing at the object with the given type and MOID"""
+    return {"class_id": "mo.MoRef", "object_type": object_type, "moid": moid}
+
+def build_eth_if(index, switch_id, group_moid, mac_pool_moid, qos_moid, adapter_moid, lan_policy):
+    """Build the vnic.EthIf body for vNIC eth<index> on the given fabric of a LAN connectivity policy"""
+    return {
+        "class_id": "vnic.EthIf",
+        "object_type": "vnic.EthIf",
+        "name": f"eth{index}_{lan_policy.name}",  # Make the name unique
+        "order": index,
+        "placement": {
+            "class_id": "vnic.PlacementSettings",
+            "object_type": "vnic.PlacementSettings",
+            "id": "MLOM",
+            "pci_link": index,
+            "switch_id": switch_id,
+            "uplink": 0
+        },
+        "cdn": {
+            "class_id": "vnic.Cdn",
+            "object_type": "vnic.Cdn",
+            "source": "vnic",
+            "value": f"eth{index}"
+        },
+        "eth_qos_policy": moref("vnic.EthQosPolicy", qos_moid),
+        "eth_adapter_policy": moref("vnic.EthAdapterPolicy", adapter_moid),
+        "fabric_eth_network_group_policy": [moref("fabric.EthNetworkGroupPolicy", group_moid)],
+        "lan_connectivity_policy": moref("vnic.LanConnectivityPolicy", lan_policy.moid),
+        "mac_pool": moref("macpool.Pool", mac_pool_moid)
+    }
+
+def _create_vnic_policy(api_client, policy_name, policy_data, org_ref):
+    """Create a LAN connectivity policy with its adapter, network groups and eth0/eth1 vNICs"""
+    org_moid = org_ref['moid']
+    qos_moid = get_policy_moid(api_client, "vnic.EthQosPolicy", "Ai_POD-QoS")
+
+    # Create Ethernet Adapter Policy
+    eth_adapter = {
+        "class_id": "vnic.EthAdapterPolicy",
+        "object_type": "vnic.EthAdapterPolicy",
+        "name": f"{policy_name}-eth-adapter",
+        "organization": org_ref,
+        "rss_settings": True,
+        "uplink_failback_timeout": 5,
+        "interrupt_settings": {
+            "coalescing_time": 125,
+            "coalescing_type": "MIN",
+            "count": 4,
+            "mode": "MSIx"
+        },
+        "rx_queue_settings": {
+            "count": 1,
+            "ring_size": 512
+        },
+        "tx_queue_settings": {
+            "count": 1,
+            "ring_size": 256
+        },
+        "completion_queue_settings": {
+            "count": 2,
+            "ring_size": 1
+        },
+        "tcp_offload_settings": {
+            "large_receive": True,
+            "large_send": True,
+            "rx_checksum": True,
+            "tx_checksum": True
+        },
+        "advanced_filter": True
+    }
+
+    # Create Network Group Policies for Fabric A and B
+    network_group_a = {
+        "class_id": "fabric.EthNetworkGroupPolicy",
+        "object_type": "fabric.EthNetworkGroupPolicy",
+        "name": f"{policy_name}-network-group-A",
+        "organization": org_ref,
+        "vlan_settings": dict(VLAN_DEFAULTS)
+    }
+
+    network_group_b = {
+        "class_id": "fabric.EthNetworkGroupPolicy",
+        "object_type": "fabric.EthNetworkGroupPolicy",
+        "name": f"{policy_name}-network-group-B",
+        "organization": org_ref,
+        "vlan_settings": dict(VLAN_DEFAULTS)
+    }
+
+    # Create vNIC Policy
+    lan_connectivity = {
+        "class_id": "vnic.LanConnectivityPolicy",
+        "object_type": "vnic.LanConnectivityPolicy",
+        "name": policy_name,
+        "organization": org_ref,
+        "target_platform": "FIAttached"
+    }
+
+    # The adapter, network group and LAN connectivity policies don't reference
+    # each other, so create them in one bulk request
+    eth_adapter_result, group_a_result, group_b_result, lan_policy = bulk_create(api_client, [
+        ('/vnic/EthAdapterPolicies', VnicEthAdapterPolicy, eth_adapter),
+        ('/fabric/EthNetworkGroupPolicies', FabricEthNetworkGroupPolicy, network_group_a),
+        ('/fabric/EthNetworkGroupPolicies', FabricEthNetworkGroupPolicy, network_group_b),
+        ('/vnic/LanConnectivityPolicies', VnicLanConnectivityPolicy, lan_connectivity),
+    ])
+    logger.info("Successfully created Ethernet Adapter Policy: %s", eth_adapter_result.name)
+    logger.info("Successfully created Network Group Policy A: %s", group_a_result.name)
+    logger.info("Successfully created Network Group Policy B: %s", group_b_result.name)
+    logger.info("Successfully created vNIC LAN Connectivity Policy: %s", lan_policy.name)
+
+    # Create one vNIC per fabric; eth0 uses fabric A and eth1 fabric B
+    fabrics = [
+        (0, "A", group_a_result.moid, get_mac_pool_moid(api_client, "Ai_POD-MAC-A", org_moid)),
+        (1, "B", group_b_result.moid, get_mac_pool_moid(api_client, "Ai_POD-MAC-B", org_moid)),
+    ]
+    eth_ifs = []
+    for index, switch_id, group_moid, mac_pool_moid in fabrics:
+        eth_if = build_eth_if(index, switch_id, group_moid, mac_pool_moid,
+                              qos_moid, eth_adapter_result.moid, lan_policy)
+        if check_vnic_exists(api_client, eth_if["name"], lan_policy.moid):
+            logger.info("vNIC %s already exists, skipping creation", eth_if['name'])
+        else:
+            eth_ifs.append(eth_if)
+
+    if eth_ifs:
+        logger.info("Creating vNICs %s...", ', '.join(eth_if['name'] for eth_if in eth_ifs))
+        for result in bulk_create(api_client, [('/vnic/EthIfs', VnicEthIf, eth_if) for eth_if in eth_ifs]):
+            logger.info("Successfully created vNIC %s", result.name)
+            _VNIC_NAME_CACHE.get((id(api_client), lan_policy.moid), set()).add(result.name)
+
+    return True
+
+def _create_storage_policy(api_client, policy_name, policy_data, org_ref):
+    """Create a RAID0 storage policy"""
+    api_instance = storage_api.StorageApi(api_client)
+
+    # Create virtual drive policy
+    virtual_drive_policy = StorageVirtualDrivePolicy(
+        drive_cache="Default",
+        read_policy="Default",
+        strip_size=512,
+        access_policy="Default"
+    )
+
+    # Create RAID0 drive configuration
+    raid0_drive = StorageR0Drive(
+        enable=True,
+        virtual_drive_policy=virtual_drive_policy
+    )
+
+    # Create storage policy
+    storage_pol = StorageStoragePolicy(
+        name=policy_name,
+        description=policy_data.get('Description', ''),
+        organization=org_ref,
+        default_drive_mode="RAID0",
+        raid0_drive=raid0_drive,
+        unused_disks_state="NoChange",
+        use_jbod_for_vd_creation=False
+    )
+
+    try:
+        with create_rate_limit():
+            result = api_instance.create_storage_storage_policy(storage_storage_policy=storage_pol)
+        logger.info("Successfully created Storage Policy: %s", result.name)
+        return True
+    except Exception as e:
+        logger.error("Error creating Storage policy: %s", e)
+        raise
+
+def _create_boot_policy(api_client, policy_name, policy_data, org_ref):
+    """Create a UEFI boot policy (local disk, UEFI shell, PXE)"""
+    api_instance = boot_api.BootApi(api_client)
+
+    # Create UEFI Shell boot device
+    boot_uefi = BootUefiShell(
+        class_id="boot.UefiShell",
+        object_type="boot.UefiShell",
+        name="uefi1",
+        enabled=True
+    )
+
+    # Create PXE boot device
+    boot_pxe = BootPxe(
+        class_id="boot.Pxe",
+        object_type="boot.Pxe",
+        name="pxe1",
+        interface_name="eth0",
+        ip_type="IPv4",
+        enabled=True
+    )
+
+    # Create local disk boot device
+    boot_local_disk = BootDeviceBase(
+        class_id="boot.LocalDisk",
+        object_type="boot.LocalDisk",
+        name="local_disk1",
+        enabled=True
+    )
+
+    # Create boot devices list
+    boot_devices = [
+        boot_local_disk,
+        boot_uefi,
+        boot_pxe
+    ]
+
+    # Create boot policy with the boot devices
+    boot_pol = BootPrecisionPolicy(
+        name=policy_name,
+        description=policy_data.get('Description', ''),
+        organization=org_ref,
+        configured_boot_mode="Uefi",
+        boot_devices=boot_devices
+    )
+
+    try:
+        with create_rate_limit():
+            result = api_instance.create_boot_precision_policy(boot_precision_policy=boot_pol)
+        logger.info("Successfully created Boot Policy: %s", result.name)
+        return True
+    except Exception as e:
+        logger.error("Error creating Boot policy: %s", e)
+        raise
+
+# Policy builders keyed by the 'Policy Type' column of the Policies sheet
+POLICY_BUILDERS = {
+    'BIOS': _create_bios_policy,
+    'QoS': _create_qos_policy,
+    'vNIC': _create_vnic_policy,
+    'Storage': _create_storage_policy,
+    'Boot': _create_boot_policy,
+}
+
 def create_policy(api_client, policy_data):
     """
     Create a policy in Intersight based on the provided data
@@ -2998,378 +3424,48 @@ def create_policy(api_client, policy_data):
         # Get Gruve organization MOID
         org_moid = get_org_moid(api_client, "Gruve")
         if not org_moid:
-            print("Error: Gruve organization not found")
+            logger.error("Error: Gruve organization not found")
             return False
 
-        org_ref = {
-            "class_id": "mo.MoRef",
-            "object_type": "organization.Organization",
-            "moid": org_moid
-        }
+        org_ref = moref("organization.Organization", org_moid)
         
-        print(f"\nCreating {policy_type} policy: {policy_name}")
+        logger.info("Creating %s policy: %s", policy_type, policy_name)
         
-        if policy_type == 'BIOS':
-            from intersight.api import bios_api
-            from intersight.model.bios_policy import BiosPolicy
-            
-            api_instance = bios_api.BiosApi(api_client)
-            
-            # Create BIOS policy with performance settings
-            policy = BiosPolicy(
-                class_id="bios.Policy",
-                object_type="bios.Policy",
-                name=policy_name,
-                organization=org_ref,
-                cpu_performance="enterprise",
-                cpu_power_management="performance",
-                cpu_energy_performance="performance",
-                intel_virtualization_technology="enabled"
-            )
-            
-            result = api_instance.create_bios_policy(policy)
-            print(f"Successfully created BIOS Policy: {result.name}")
-            return True
-            
-        elif policy_type == 'QoS':
-            from intersight.api import vnic_api
-            
-            api_instance = vnic_api.VnicApi(api_client)
-            
-            # Create QoS policy
-            qos = {
-                "name": policy_name,
-                "organization": org_ref,
-                "mtu": 9000,
-                "rate_limit": 0,
-                "cos": 5,
-                "burst": 1024,
-                "priority": "Best Effort",
-                "class_id": "vnic.EthQosPolicy",
-                "object_type": "vnic.EthQosPolicy"
-            }
-            
-            result = api_instance.create_vnic_eth_qos_policy(qos)
-            print(f"Successfully created QoS Policy: {result.name}")
-            return True
-            
-        elif policy_type == 'vNIC':
-            from intersight.api import vnic_api, fabric_api
-            from intersight.model.vnic_lan_connectivity_policy import VnicLanConnectivityPolicy
-            from intersight.model.vnic_eth_if import VnicEthIf
-            
-            # Create API instances
-            vnic_instance = vnic_api.VnicApi(api_client)
-            fabric_instance = fabric_api.FabricApi(api_client)
-            
-            # Create Ethernet Adapter Policy
-            eth_adapter = {
-                "class_id": "vnic.EthAdapterPolicy",
-                "object_type": "vnic.EthAdapterPolicy",
-                "name": f"{policy_name}-eth-adapter",
-                "organization": org_ref,
-                "rss_settings": True,
-                "uplink_failback_timeout": 5,
-                "interrupt_settings": {
-                    "coalescing_time": 125,
-                    "coalescing_type": "MIN",
-                    "count": 4,
-                    "mode": "MSIx"
-                },
-                "rx_queue_settings": {
-                    "count": 1,
-                    "ring_size": 512
-                },
-                "tx_queue_settings": {
-                    "count": 1,
-                    "ring_size": 256
-                },
-                "completion_queue_settings": {
-                    "count": 2,
-                    "ring_size": 1
-                },
-                "tcp_offload_settings": {
-                    "large_receive": True,
-                    "large_send": True,
-                    "rx_checksum": True,
-                    "tx_checksum": True
-                },
-                "advanced_filter": True
-            }
-            
-            eth_adapter_result = vnic_instance.create_vnic_eth_adapter_policy(eth_adapter)
-            print(f"Successfully created Ethernet Adapter Policy: {eth_adapter_result.name}")
-
-            # Create Network Group Policies for Fabric A and B
-            network_group_a = {
-                "class_id": "fabric.EthNetworkGroupPolicy",
-                "object_type": "fabric.EthNetworkGroupPolicy",
-                "name": f"{policy_name}-network-group-A",
-                "organization": org_ref,
-                "vlan_settings": {
-                    "native_vlan": 1,
-                    "allowed_vlans": "2-100"
-                }
-            }
-            
-            network_group_b = {
-                "class_id": "fabric.EthNetworkGroupPolicy",
-                "object_type": "fabric.EthNetworkGroupPolicy",
-                "name": f"{policy_name}-network-group-B",
-                "organization": org_ref,
-                "vlan_settings": {
-                    "native_vlan": 1,
-                    "allowed_vlans": "2-100"
-                }
-            }
-            
-            group_a_result = fabric_instance.create_fabric_eth_network_group_policy(network_group_a)
-            print(f"Successfully created Network Group Policy A: {group_a_result.name}")
-            
-            group_b_result = fabric_instance.create_fabric_eth_network_group_policy(network_group_b)
-            print(f"Successfully created Network Group Policy B: {group_b_result.name}")
-
-            # Create vNIC Policy
-            lan_connectivity = {
-                "class_id": "vnic.LanConnectivityPolicy",
-                "object_type": "vnic.LanConnectivityPolicy",
-                "name": policy_name,
-                "organization": org_ref,
-                "target_platform": "FIAttached"
-            }
-            
-            lan_policy = vnic_instance.create_vnic_lan_connectivity_policy(lan_connectivity)
-            print(f"Successfully created vNIC LAN Connectivity Policy: {lan_policy.name}")
-
-            # Create vNIC eth0 for Fabric A
-            eth0 = {
-                "class_id": "vnic.EthIf",
-                "object_type": "vnic.EthIf",
-                "name": f"eth0_{lan_policy.name}",  # Make the name unique
-                "order": 0,
-                "placement": {
-                    "class_id": "vnic.PlacementSettings",
-                    "object_type": "vnic.PlacementSettings",
-                    "id": "MLOM",
-                    "pci_link": 0,
-                    "switch_id": "A",
-                    "uplink": 0
-                },
-                "cdn": {
-                    "class_id": "vnic.Cdn",
-                    "object_type": "vnic.Cdn",
-                    "source": "vnic",
-                    "value": "eth0"
-                },
-                "eth_qos_policy": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "vnic.EthQosPolicy",
-                    "moid": get_policy_moid(api_client, "vnic.EthQosPolicy", "Ai_POD-QoS")
-                },
-                "eth_adapter_policy": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "vnic.EthAdapterPolicy",
-                    "moid": eth_adapter_result.moid
-                },
-                "fabric_eth_network_group_policy": [{
-                    "class_id": "mo.MoRef",
-                    "object_type": "fabric.EthNetworkGroupPolicy",
-                    "moid": group_a_result.moid
-                }],
-                "lan_connectivity_policy": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "vnic.LanConnectivityPolicy",
-                    "moid": lan_policy.moid
-                },
-                "mac_pool": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "macpool.Pool",
-                    "moid": get_mac_pool_moid(api_client, "Ai_POD-MAC-A", org_moid)
-                }
-            }
-
-            # Create vNIC eth1 for Fabric B
-            eth1 = {
-                "class_id": "vnic.EthIf",
-                "object_type": "vnic.EthIf",
-                "name": f"eth1_{lan_policy.name}",  # Make the name unique
-                "order": 1,
-                "placement": {
-                    "class_id": "vnic.PlacementSettings",
-                    "object_type": "vnic.PlacementSettings",
-                    "id": "MLOM",
-                    "pci_link": 1,  # Different PCI link for eth1
-                    "switch_id": "B",
-                    "uplink": 0
-                },
-                "cdn": {
-                    "class_id": "vnic.Cdn",
-                    "object_type": "vnic.Cdn",
-                    "source": "vnic",
-                    "value": "eth1"
-                },
-                "eth_qos_policy": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "vnic.EthQosPolicy",
-                    "moid": get_policy_moid(api_client, "vnic.EthQosPolicy", "Ai_POD-QoS")
-                },
-                "eth_adapter_policy": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "vnic.EthAdapterPolicy",
-                    "moid": eth_adapter_result.moid
-                },
-                "fabric_eth_network_group_policy": [{
-                    "class_id": "mo.MoRef",
-                    "object_type": "fabric.EthNetworkGroupPolicy",
-                    "moid": group_b_result.moid
-                }],
-                "lan_connectivity_policy": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "vnic.LanConnectivityPolicy",
-                    "moid": lan_policy.moid
-                },
-                "mac_pool": {
-                    "class_id": "mo.MoRef",
-                    "object_type": "macpool.Pool",
-                    "moid": get_mac_pool_moid(api_client, "Ai_POD-MAC-B", org_moid)
-                }
-            }
-
-            # Create the vNICs
-            eth0_name = f"eth0_{lan_policy.name}"
-            eth1_name = f"eth1_{lan_policy.name}"
-
-            if not check_vnic_exists(api_client, eth0_name, lan_policy.moid):
-                print("\nCreating vNIC eth0 for Fabric A...")
-                eth0_result = vnic_instance.create_vnic_eth_if(eth0)
-                print(f"Successfully created vNIC eth0 for Fabric A")
-            else:
-                print(f"\nvNIC {eth0_name} already exists, skipping creation")
-
-            if not check_vnic_exists(api_client, eth1_name, lan_policy.moid):
-                print("\nCreating vNIC eth1 for Fabric B...")
-                eth1_result = vnic_instance.create_vnic_eth_if(eth1)
-                print(f"Successfully created vNIC eth1 for Fabric B")
-            else:
-                print(f"\nvNIC {eth1_name} already exists, skipping creation")
-            
-            return True
-            
-        elif policy_type == 'Storage':
-            from intersight.api import storage_api
-            from intersight.model.storage_storage_policy import StorageStoragePolicy
-            from intersight.model.storage_virtual_drive_policy import StorageVirtualDrivePolicy
-            from intersight.model.storage_r0_drive import StorageR0Drive
-            
-            api_instance = storage_api.StorageApi(api_client)
-            
-            # Create virtual drive policy
-            virtual_drive_policy = StorageVirtualDrivePolicy(
-                drive_cache="Default",
-                read_policy="Default",
-                strip_size=512,
-                access_policy="Default"
-            )
-            
-            # Create RAID0 drive configuration
-            raid0_drive = StorageR0Drive(
-                enable=True,
-                virtual_drive_policy=virtual_drive_policy
-            )
-            
-            # Create storage policy
-            storage_pol = StorageStoragePolicy(
-                name=policy_name,
-                description=policy_data.get('Description', ''),
-                organization=org_ref,
-                default_drive_mode="RAID0",
-                raid0_drive=raid0_drive,
-                unused_disks_state="NoChange",
-                use_jbod_for_vd_creation=False
-            )
-            
-            try:
-                result = api_instance.create_storage_storage_policy(storage_storage_policy=storage_pol)
-                print(f"Successfully created Storage Policy: {result.name}")
-                return True
-            except Exception as e:
-                print(f"Error creating Storage policy: {str(e)}")
-                raise
-            
-        elif policy_type == 'Boot':
-            from intersight.api import boot_api
-            from intersight.model.boot_precision_policy import BootPrecisionPolicy
-            from intersight.model.boot_device_base import BootDeviceBase
-            from intersight.model.boot_uefi_shell import BootUefiShell
-            from intersight.model.boot_pxe import BootPxe
-            
-            api_instance = boot_api.BootApi(api_client)
-            
-            # Create UEFI Shell boot device
-            boot_uefi = BootUefiShell(
-                class_id="boot.UefiShell",
-                object_type="boot.UefiShell",
-                name="uefi1",
-                enabled=True
-            )
-            
-            # Create PXE boot device
-            boot_pxe = BootPxe(
-                class_id="boot.Pxe",
-                object_type="boot.Pxe",
-                name="pxe1",
-                interface_name="eth0",
-                ip_type="IPv4",
-                enabled=True
-            )
-            
-            # Create local disk boot device
-            boot_local_disk = BootDeviceBase(
-                class_id="boot.LocalDisk",
-                object_type="boot.LocalDisk",
-                name="local_disk1",
-                enabled=True
-            )
-            
-            # Create boot devices list
-            boot_devices = [
-                boot_local_disk,
-                boot_uefi,
-                boot_pxe
-            ]
-            
-            # Create boot policy with the boot devices
-            boot_pol = BootPrecisionPolicy(
-                name=policy_name,
-                description=policy_data.get('Description', ''),
-                organization=org_ref,
-                configured_boot_mode="Uefi",
-                boot_devices=boot_devices
-            )
-            
-            try:
-                result = api_instance.create_boot_precision_policy(boot_precision_policy=boot_pol)
-                print(f"Successfully created Boot Policy: {result.name}")
-                return True
-            except Exception as e:
-                print(f"Error creating Boot policy: {str(e)}")
-                raise
-            
-        else:
-            print(f"Unsupported policy type: {policy_type}")
+        builder = POLICY_BUILDERS.get(policy_type)
+        if builder is None:
+            logger.error("Unsupported policy type: %s", policy_type)
             return False
+        return builder(api_client, policy_name, policy_data, org_ref)
             
     except Exception as e:
-        print(f"Error creating {policy_type} policy: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error creating %s policy: %s", policy_type, e)
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
-def update_profiles_with_server_info(api_client, excel_file):
-    """Update the Profiles sheet with server information from Intersight"""
+def ensure_policy(api_client, policy_type, policy_name, policy_data):
+    """Create a policy unless it already exists; returns 'exists', 'created' or 'failed'"""
+    class_id = get_policy_class_id(policy_type)
+    if policy_exists(api_client, class_id, policy_name):
+        return 'exists'
+    if not create_policy(api_client, policy_data):
+        return 'failed'
+    # Prefetched types answer existence from _MOID_CACHE alone, so record the new
+    # policy there or a later row with the same name would try to create it again
+    if (id(api_client), class_id) in _PREFETCHED_TYPES:
+        get_policy_moid(api_client, class_id, policy_name)
+    return 'created'
+
+def update_profiles_with_server_info(api_client, excel_file, workbook=None, defer_save=False):
+    """
+    Update the Profiles sheet with server information from Intersight
+    
+    Pass an already loaded workbook to chain several updates, and defer_save=True
+    to get the workbook back unsaved so the caller can save it once at the end.
+    """
     try:
-        # Load workbook
-        workbook = load_workbook(excel_file)
+        # Load workbook (external links are never used by the template)
+        if workbook is None:
+            workbook = load_workbook(excel_file, keep_vba=False, keep_links=False)
         if 'Profiles' not in workbook.sheetnames:
             print("No Profiles sheet found in Excel file")
             return False
@@ -3377,26 +3473,28 @@ def update_profiles_with_server_info(api_client, excel_file):
         profiles_sheet = workbook['Profiles']
         
         # Get servers from Intersight
-        compute_api_instance = compute_api.ComputeApi(api_client)
-        servers = compute_api_instance.get_compute_rack_unit_list()
+        servers = get_rack_units(api_client)
         
         # Collect server info for dropdown
-        server_options = [f"{server.name} | SN: {server.serial}" for server in servers.results]
-        server_list = ','.join(server_options)
+        server_options = [f"{server['name']} | SN: {server['serial']}" for server in servers]
+        server_formula = write_lookup_list(workbook, 'A', 'Servers', server_options)
         
-        # Add server dropdown to row 2
+        # Add server dropdown to the whole server column as a single range
         server_validation = DataValidation(
             type='list',
-            formula1=f'"{server_list}"',
+            formula1=server_formula,
             allow_blank=True
         )
         profiles_sheet.add_data_validation(server_validation)
-        server_validation.add('E2')
-        print("Added server dropdown to row 2 in Profiles sheet")
+        server_validation.add('E2:E1000')
+        print("Added server dropdown to Profiles sheet")
+        
+        if defer_save:
+            return workbook
         
         # Save workbook
         try:
-            workbook.save(excel_file)
+            save_workbook(workbook, excel_file)
             print("Successfully saved Excel file")
         except Exception as e:
             print(f"Failed to save Excel file: {str(e)}")
@@ -3405,13 +3503,12 @@ def update_profiles_with_server_info(api_client, excel_file):
         
     except Exception as e:
         print(f"Error updating Profiles sheet: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 # Define retry decorator directly in script to avoid import issues
-def retry_api_call(max_retries=3, delay=2):
-    """Decorator to retry API calls with exponential backoff"""
+def retry_api_call(max_retries=3, delay=2, max_delay=30):
+    """Decorator to retry transient API failures with jittered exponential backoff"""
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -3421,32 +3518,38 @@ def retry_api_call(max_retries=3, delay=2):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
+                    # Client errors such as a policy still in "Validating" state won't clear up on retry
+                    if isinstance(e, ApiException) and e.status not in RETRYABLE_STATUS_CODES:
+                        raise
+                    
                     retries += 1
                     if retries >= max_retries:
                         print(f"API call failed after {max_retries} attempts: {str(e)}")
                         raise
                     
-                    print(f"API call failed. Retrying in {current_delay}s... ({retries}/{max_retries})")
-                    time.sleep(current_delay)
-                    current_delay *= 1.5  # Exponential backoff
+                    # Full jitter keeps concurrent workers from retrying in lockstep
+                    sleep_for = random.uniform(0, min(current_delay, max_delay))
+                    print(f"API call failed. Retrying in {sleep_for:.1f}s... ({retries}/{max_retries})")
+                    time.sleep(sleep_for)
+                    current_delay = min(current_delay * 1.5, max_delay)  # Exponential backoff
         return wrapper
     return decorator
 
-# Fallback print functions if utils module import failed
+# Fallback print functions if utils module import failed; routed through the module logger
 def print_info(message):
-    print(message)
+    logger.info(message)
     
 def print_success(message):
-    print(message)
+    logger.info(message)
     
 def print_warning(message):
-    print(message)
+    logger.warning(message)
     
 def print_error(message):
-    print(message)
+    logger.error(message)
 
 def progress_bar(iterable, desc="", total=None):
-    return iterable
+    return tqdm(iterable, desc=desc, total=total)
 
 def print_summary(title, success_items, failed_items):
     print(f"\n{title} Summary")
@@ -3455,86 +3558,79 @@ def print_summary(title, success_items, failed_items):
     if failed_items:
         print(f"Failed to process {len(failed_items)} items")
         
+def _blank_mask(values):
+    """Vectorized equivalent of `not value or pd.isna(value)` for a column"""
+    return values.isna() | ~values.fillna(False).astype(bool)
+
+def _collect_invalid_rows(df, checks, names):
+    """Turn per-rule boolean masks into row-ordered validation messages.
+    
+    Args:
+        df: The DataFrame that was validated
+        checks: List of (mask, message template) pairs; templates may use {row} and {name}
+        names: Series used to fill in {name} for each offending row
+    """
+    problems = []
+    for rank, (mask, message) in enumerate(checks):
+        for idx in df.index[mask.to_numpy()]:
+            problems.append((idx, rank, message.format(row=idx + 2, name=names[idx])))
+    return [message for _, _, message in sorted(problems)]
+
 def validate_pools_data(pools_df):
     """Validate pools data before creating in Intersight"""
-    invalid_pools = []
-    
     # Debug: Print column names to ensure we're looking for the right columns
     print("DEBUG: Pool columns available:", pools_df.columns.tolist())
     print("\nDEBUG: First 5 rows of pool data:")
-    for i, (idx, row) in enumerate(pools_df.iterrows()):
-        if i < 5:  # Only show first 5 rows
-            print(f"DEBUG: Row {idx+2} data: {dict(row)}")
-    
-    for idx, row in pools_df.iterrows():
-        pool_type = row.get('Pool Type')
-        pool_name = row.get('Pool Name')
-        
-        # Debug: Print the values being processed
-        print(f"\nValidating Row {idx+2}:")
-        print(f"  Pool Type: '{pool_type}'")
-        print(f"  Pool Name: '{pool_name}'")
-        
-        # Check for missing required fields
-        if not pool_type or pd.isna(pool_type):
-            invalid_pools.append(f"Row {idx+2}: Missing Pool Type")
-            continue
-        
-        if not pool_name or pd.isna(pool_name):
-            invalid_pools.append(f"Row {idx+2}: Missing Pool Name")
-            continue
-            
-        # Validate pool type specific fields
-        if pool_type == 'MAC Pool':
-            # Check for either 'Start Address' or 'First Address' as the column name
-            start_addr = row.get('Start Address')
-            if start_addr is None or pd.isna(start_addr):
-                start_addr = row.get('First Address')  # Try the alternate column name
-            
-            size = row.get('Size')
-            
-            # Debug: Print the MAC Pool specific values
-            print(f"  Start/First Address: '{start_addr}' (type: {type(start_addr).__name__})")
-            print(f"  Size: '{size}' (type: {type(size).__name__})")
-            
-            if not start_addr or pd.isna(start_addr):
-                invalid_pools.append(f"Row {idx+2}: Missing Start/First Address for MAC Pool '{pool_name}'")
-            elif not isinstance(start_addr, str):
-                invalid_pools.append(f"Row {idx+2}: Invalid Start/First Address format for MAC Pool '{pool_name}'")
-            
-            if not size or pd.isna(size):
-                invalid_pools.append(f"Row {idx+2}: Missing Size for MAC Pool '{pool_name}'")
-            elif not str(size).isdigit():
-                invalid_pools.append(f"Row {idx+2}: Size must be a number for MAC Pool '{pool_name}'")
-    
-    return invalid_pools
+    for idx, row in pools_df.head(5).to_dict(orient='index').items():
+        print(f"DEBUG: Row {idx+2} data: {row}")
+    
+    empty = pd.Series(None, index=pools_df.index, dtype=object)
+    pool_type = pools_df.get('Pool Type', empty)
+    pool_name = pools_df.get('Pool Name', empty)
+    size = pools_df.get('Size', empty)
+    
+    # Check for either 'Start Address' or 'First Address' as the column name
+    start_addr = pools_df.get('Start Address', empty)
+    start_addr = start_addr.where(start_addr.notna(), pools_df.get('First Address', empty))
+    
+    # Each row reports at most one missing required field
+    missing_type = _blank_mask(pool_type)
+    missing_name = ~missing_type & _blank_mask(pool_name)
+    
+    # Validate pool type specific fields
+    mac_pool = ~missing_type & ~missing_name & (pool_type == 'MAC Pool')
+    missing_addr = mac_pool & _blank_mask(start_addr)
+    bad_addr = mac_pool & ~missing_addr & ~start_addr.map(lambda value: isinstance(value, str))
+    missing_size = mac_pool & _blank_mask(size)
+    bad_size = mac_pool & ~missing_size & ~size.astype(str).str.isdigit()
+    
+    return _collect_invalid_rows(pools_df, [
+        (missing_type, "Row {row}: Missing Pool Type"),
+        (missing_name, "Row {row}: Missing Pool Name"),
+        (missing_addr, "Row {row}: Missing Start/First Address for MAC Pool '{name}'"),
+        (bad_addr, "Row {row}: Invalid Start/First Address format for MAC Pool '{name}'"),
+        (missing_size, "Row {row}: Missing Size for MAC Pool '{name}'"),
+        (bad_size, "Row {row}: Size must be a number for MAC Pool '{name}'"),
+    ], pool_name)
 
 def validate_policies_data(policies_df):
     """Validate policies data before creating in Intersight"""
-    invalid_policies = []
+    empty = pd.Series(None, index=policies_df.index, dtype=object)
+    policy_type = policies_df.get('Policy Type', empty)
+    policy_name = policies_df.get('Policy Name', empty)
     
-    for idx, row in policies_df.iterrows():
-        policy_type = row.get('Policy Type')
-        policy_name = row.get('Policy Name')
-        
-        # Check for missing required fields
-        if not policy_type or pd.isna(policy_type):
-            invalid_policies.append(f"Row {idx+2}: Missing Policy Type")
-            continue
-        
-        if not policy_name or pd.isna(policy_name):
-            invalid_policies.append(f"Row {idx+2}: Missing Policy Name")
-            continue
+    # Check for missing required fields
+    missing_type = _blank_mask(policy_type)
+    missing_name = ~missing_type & _blank_mask(policy_name)
     
-    return invalid_policies
+    return _collect_invalid_rows(policies_df, [
+        (missing_type, "Row {row}: Missing Policy Type"),
+        (missing_name, "Row {row}: Missing Policy Name"),
+    ], policy_name)
 
 @retry_api_call(max_retries=3, delay=2)
 def create_and_derive_profile(api_client, profile_data):
     """Create a server profile and then attach it to a template using the official API approach"""
-    from intersight.api import server_api
-    from intersight.model.server_profile import ServerProfile
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     # Map DataFrame column names to expected parameter names
     profile_name = profile_data.get('Profile Name')
     template_name = profile_data.get('Template Name')
@@ -3543,23 +3639,23 @@ def create_and_derive_profile(api_client, profile_data):
     deploy = profile_data.get('Deploy', 'No')
     description = f"Server Profile for {server_name}"
     
-    print_info(f"\nCreating server profile: {profile_name}")
+    logger.info("Creating server profile: %s", profile_name)
     if deploy.lower() == "yes":
-        print_info(f"Profile {profile_name} will be deployed after creation")
+        logger.info("Profile %s will be deployed after creation", profile_name)
     
-    print_info(f"Organization: {org_name}")
-    print_info(f"Template: {template_name}")
-    print_info(f"Server: {server_name}")
+    logger.info("Organization: %s", org_name)
+    logger.info("Template: %s", template_name)
+    logger.info("Server: %s", server_name)
     
     try:
         # Create API instance
         api_instance = server_api.ServerApi(api_client)
         
         # Get organization MOID
-        print_info(f"Looking up organization: {org_name}")
+        logger.info("Looking up organization: %s", org_name)
         org_moid = get_org_moid(api_client, org_name)
         if not org_moid:
-            print_error(f"Organization {org_name} not found")
+            logger.error("Organization %s not found", org_name)
             return False
             
         # Create organization reference
@@ -3568,17 +3664,17 @@ def create_and_derive_profile(api_client, profile_data):
             object_type="organization.Organization",
             moid=org_moid
         )
-        print_success(f"Found organization with MOID: {org_moid}")
+        logger.info("Found organization with MOID: %s", org_moid)
         
         # Get template MOID - check if we have a template mapping for this name
-        if template_mappings and template_name in template_mappings:
-            mapped_template_name = template_mappings[template_name]
-            print(f"Found template mapping for {template_name} -> {mapped_template_name}")
+        mapped_template_name = template_mappings.get(template_name)
+        if mapped_template_name is not None:
+            logger.info("Found template mapping for %s -> %s", template_name, mapped_template_name)
             template_name = mapped_template_name
         
         template_moid = get_template_moid(api_client, template_name)
         if not template_moid:
-            print(f"Template {template_name} not found")
+            logger.error("Template %s not found", template_name)
             return False
         
         # Create template reference
@@ -3592,15 +3688,11 @@ def create_and_derive_profile(api_client, profile_data):
         server_ref = None
         if server_name:
             # Extract serial number if format is "Name | SN: XYZ"
-            serial_number = None
-            if " | SN: " in server_name:
-                parts = server_name.split(" | SN: ")
-                server_name = parts[0].strip()
-                serial_number = parts[1].strip()
+            server_name, serial_number = split_server_option(server_name)
             
-            server_moid = get_server_moid(api_client, server_name)
+            server_moid = get_server_moid(api_client, serial_number or server_name)
             if not server_moid:
-                print(f"Server {server_name} not found")
+                logger.error("Server %s not found", server_name)
                 return False
                 
             # Create server reference
@@ -3611,7 +3703,7 @@ def create_and_derive_profile(api_client, profile_data):
             )
         
         # STEP 1: Create ServerProfile instance following the official docs
-        print("Creating server profile using official API approach...")
+        logger.info("Creating server profile using official API approach...")
         server_profile = ServerProfile()
         server_profile.name = profile_name
         server_profile.description = description
@@ -3622,13 +3714,13 @@ def create_and_derive_profile(api_client, profile_data):
         # Don't add server during profile creation - we'll do it after template attachment
         
         # Create the profile
-        print(f"Creating profile: {profile_name}")
+        logger.info("Creating profile: %s", profile_name)
         resp_server_profile = api_instance.create_server_profile(server_profile)
         profile_moid = resp_server_profile.moid
-        print(f"Successfully created profile with MOID: {profile_moid}")
+        logger.info("Successfully created profile with MOID: %s", profile_moid)
         
         # STEP 2: Update profile to attach it to the template
-        print(f"Attaching profile to template {template_name}...")
+        logger.info("Attaching profile to template %s...", template_name)
         
         # Create update body with template reference
         update_profile = ServerProfile()
@@ -3637,18 +3729,13 @@ def create_and_derive_profile(api_client, profile_data):
         # Update the profile to attach to template
         api_instance.update_server_profile(profile_moid, update_profile)
         
-        print(f"Successfully created and attached profile {profile_name} to template")
+        logger.info("Successfully created and attached profile %s to template", profile_name)
         return True
         
     except Exception as e:
-        print(f"Error using official API approach: {str(e)}")
-        print("\n⚠️ Unable to create server profile with template attachment.")
-        print("This profile will need to be created manually in the Intersight UI.")
-        
-        # Store profile for manual creation report
-        if 'profiles_for_manual_creation' not in globals():
-            global profiles_for_manual_creation
-            profiles_for_manual_creation = []
+        logger.error("Error using official API approach: %s", e)
+        logger.warning("⚠️ Unable to create server profile with template attachment.")
+        logger.warning("This profile will need to be created manually in the Intersight UI.")
         
         # Store info needed for manual creation
         profile_info = {
@@ -3658,16 +3745,13 @@ def create_and_derive_profile(api_client, profile_data):
             'server': server_name,
             'deploy': deploy
         }
-        profiles_for_manual_creation.append(profile_info)
+        with _MANUAL_CREATION_LOCK:
+            profiles_for_manual_creation.append(profile_info)
         
         return False
 
 def create_basic_server_profile(api_client, profile_name, org_moid, server_moid=None):
     """Create a basic server profile"""
-    from intersight.api import server_api
-    from intersight.model.server_profile import ServerProfile
-    from intersight.model.mo_mo_ref import MoMoRef
-    
     try:
         # Create organization reference
         org_ref = MoMoRef(
@@ -3738,32 +3822,28 @@ def create_basic_server_profile(api_client, profile_name, org_moid, server_moid=
             _preload_content=True,
             collection_formats=collection_formats)
         
-        print(f"Successfully created Server Profile: {profile_name}")
+        logger.info("Successfully created Server Profile: %s", profile_name)
         return profile_name
     
     except Exception as e:
-        print(f"Error creating Server Profile: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error creating Server Profile: %s", e)
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 def derive_profile_from_template(api_client, profile_moid, template_moid):
     """Derive a server profile from a template"""
-    from intersight.api import server_api
-    
     try:
         # Create API instance
         api_instance = server_api.ServerApi(api_client)
         
         # Derive the profile from the template
         api_instance.derive_server_profile(server_profile_moid=profile_moid, server_profile_template_moid=template_moid)
-        print(f"Successfully derived Server Profile from Template")
+        logger.info("Successfully derived Server Profile from Template")
         return True
     
     except Exception as e:
-        print(f"Error deriving Server Profile from Template: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.error("Error deriving Server Profile from Template: %s", e)
+        logger.debug("Traceback for the error above", exc_info=True)
         return False
 
 if __name__ == "__main__":
@@ -3771,8 +3851,15 @@ if __name__ == "__main__":
     parser.add_argument('--action', choices=['push', 'template', 'profiles', 'all', 'setup', 'create-template', 'get-info', 'update-servers'], required=True,
                       help='Action to perform: push (create pools and policies), template (create server template), profiles (create server profiles), all (do everything), setup (just set up Excel file), create-template (create fresh template), get-info (get current Intersight information), update-servers (update server info in Profiles sheet)')
     parser.add_argument('--file', default='output/Intersight_Template.xlsx', help='Path to Excel file (default: output/Intersight_Template.xlsx)')
+    parser.add_argument('--no-cache', action='store_true', help='Always query Intersight instead of reusing recent results cached on disk')
+    parser.add_argument('--debug', action='store_true', help='Log debug details, including tracebacks for failed rows')
     args = parser.parse_args()
     
+    if args.no_cache:
+        DISK_CACHE_ENABLED = False
+    if args.debug:
+        logger.setLevel(logging.DEBUG)
+    
     if args.action == 'update-servers':
         api_client = get_api_client()
         if not api_client:
@@ -3850,6 +3937,8 @@ if __name__ == "__main__":
         print('--- Finished retrieving Intersight information ---\n')
         
         if args.action in ['push', 'all']:
+            # One list call per policy type up front instead of a lookup per row
+            prefetch_moids(api_client)
             process_foundation_template(args.file)
         
         if args.action in ['template', 'all']:
@@ -21,6 +21,13 @@ FORMAT = '%(asctime)-15s [%(levelname)s] [%(filename)s:%(lineno)s] %(message)s'
 logging.basicConfig(format=FORMAT, level=logging.INFO)
 logger = logging.getLogger('intersight_rg_mapper')
 
+def _device_attr(reg, attr):
+    """Get a device registration attribute, taking the first item when the API returns a list"""
+    value = getattr(reg, attr, None)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    return value
+
 def get_api_client():
     """Get Intersight API client with proper authentication"""
     try:
@@ -129,22 +136,20 @@ def map_servers_to_resource_groups(server_details):
                         if not device_moid:
                             continue
                             
-                        # Output device details for debugging
-                        raw_hostname = getattr(reg, 'device_hostname', 'Unknown')
-                        raw_serial = getattr(reg, 'serial', 'Unknown')
+                        # Read hostname and serial once per device rather than
+                        # once per server compared against below
+                        device_hostname = _device_attr(reg, 'device_hostname')
+                        device_serial = _device_attr(reg, 'serial')
                         
-                        # Format hostname properly for display
-                        hostname_display = raw_hostname
-                        if isinstance(raw_hostname, list) and raw_hostname:
-                            hostname_display = raw_hostname[0]
-                            
-                        # Format serial properly for display
-                        serial_display = raw_serial
-                        if isinstance(raw_serial, list) and raw_serial:
-                            serial_display = raw_serial[0]
-                            
+                        # Output device details for debugging
+                        hostname_display = device_hostname if device_hostname is not None else 'Unknown'
+                        serial_display = device_serial if device_serial is not None else 'Unknown'
                         logger.info(f"    Found device in resource group: {hostname_display} / {serial_display} / MOID: {device_moid}")
                         
+                        device_hostname_lower = device_hostname.lower() if isinstance(device_hostname, str) and device_hostname else None
+                        if not (isinstance(device_serial, str) and device_serial):
+                            device_serial = None
+                        
                         # Try to match by hostname, serial, or MOID to our server list
                         for serial, server in server_details.items():
                             # Various ways to match servers
@@ -153,26 +158,14 @@ def map_servers_to_resource_groups(server_details):
                             moid_match = False
                             
                             # Check hostname match (case insensitive)
-                            if hasattr(reg, 'device_hostname') and reg.device_hostname:
-                                # Handle both string and list formats
-                                device_hostname = reg.device_hostname
-                                if isinstance(device_hostname, list) and device_hostname:
-                                    device_hostname = device_hostname[0]  # Take first item if it's a list
-                                
-                                if isinstance(device_hostname, str) and isinstance(server['name'], str):
-                                    hostname_match = server['name'].lower() == device_hostname.lower()
-                                    logger.info(f"       Hostname comparison: '{server['name'].lower()}' vs '{device_hostname.lower()}' = {hostname_match}")
+                            if device_hostname_lower is not None and isinstance(server['name'], str):
+                                hostname_match = server['name'].lower() == device_hostname_lower
+                                logger.info(f"       Hostname comparison: '{server['name'].lower()}' vs '{device_hostname_lower}' = {hostname_match}")
                             
                             # Check serial match (exact match)
-                            if hasattr(reg, 'serial') and reg.serial:
-                                # Handle both string and list formats
-                                device_serial = reg.serial
-                                if isinstance(device_serial, list) and device_serial:
-                                    device_serial = device_serial[0]  # Take first item if it's a list
-                                
-                                if isinstance(device_serial, str):
-                                    serial_match = server.get('serial') == device_serial
-                                    logger.info(f"       Serial comparison: '{server.get('serial')}' vs '{device_serial}' = {serial_match}")
+                            if device_serial is not None:
+                                serial_match = server.get('serial') == device_serial
+                                logger.info(f"       Serial comparison: '{server.get('serial')}' vs '{device_serial}' = {serial_match}")
                             
                             # Check MOID match if server has MOID
                             if server.get('moid') and device_moid:
@@ -19,6 +19,17 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
+# Header styling shared by every sheet this script writes headers to
+HEADER_FONT = Font(bold=True)
+HEADER_FILL = PatternFill(start_color='FFA0D7BE', end_color='FFA0D7BE', fill_type='solid')
+
+def write_header(sheet, headers):
+    """Write a styled header row into row 1 of a sheet"""
+    for col, header in enumerate(headers, 1):
+        cell = sheet.cell(row=1, column=col, value=header)
+        cell.font = HEADER_FONT
+        cell.fill = HEADER_FILL
+
 def get_api_client():
     """Get Intersight API client with proper authentication"""
     try:
@@ -402,15 +413,8 @@ def update_intersight_data(excel_file):
         print("  This error indicates we can't create the hidden sheet for resource group filtering.")
         print("  Will attempt to continue with standard dropdowns.")
     
-    # Add headers
-    servermap_sheet.cell(row=1, column=1).value = "Resource Group"
-    servermap_sheet.cell(row=1, column=2).value = "Server"
-    
-    # Style headers
-    for col in range(1, 3):
-        cell = servermap_sheet.cell(row=1, column=col)
-        cell.font = Font(bold=True)
-        cell.fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')
+    # Add styled headers
+    write_header(servermap_sheet, ["Resource Group", "Server"])
     
     # Set up column widths
     servermap_sheet.column_dimensions['A'].width = 30  # Resource Group
@@ -683,22 +687,20 @@ def update_intersight_data(excel_file):
                         for dv in to_remove:
                             profiles_sheet.data_validations.dataValidation.remove(dv)
                         
-                        # Then add row-specific validations that reference the resource group
-                        for row in range(2, 51):  # Limit to 50 rows for stability
-                            try:
-                                # Create a formula that references the resource group in each row
-                                # When resource group changes, the server list will update dynamically
-                                # Create a more Excel-compatible formula
-                                # 1. Using CONCATENATE instead of & for older Excel versions
-                                # 2. Making sure the formula is well-formed
-                                formula = f'=INDIRECT(CONCATENATE(SUBSTITUTE(SUBSTITUTE({rg_col_letter}{row}," ","_"),"-","_"),"_Servers"))'
-                                
-                                # Create a validation just for this cell
-                                cell_dv = DataValidation(type='list', formula1=formula, allow_blank=True)
-                                cell_dv.add(f"{server_col_letter}{row}")
-                                profiles_sheet.add_data_validation(cell_dv)
-                            except Exception as e:
-                                print(f"  - Error adding validation for row {row}: {str(e)}")
+                        # Then add one validation over rows 2-50 that references the resource group
+                        # The row reference in the formula is relative, so Excel resolves it per cell
+                        # from the top-left cell of the range - one rule instead of one per row
+                        try:
+                            # Create a more Excel-compatible formula
+                            # 1. Using CONCATENATE instead of & for older Excel versions
+                            # 2. Making sure the formula is well-formed
+                            formula = f'=INDIRECT(CONCATENATE(SUBSTITUTE(SUBSTITUTE({rg_col_letter}2," ","_"),"-","_"),"_Servers"))'
+                            
+                            rg_servers_dv = DataValidation(type='list', formula1=formula, allow_blank=True)
+                            rg_servers_dv.add(f"{server_col_letter}2:{server_col_letter}50")  # Limit to 50 rows for stability
+                            profiles_sheet.add_data_validation(rg_servers_dv)
+                        except Exception as e:
+                            print(f"  - Error adding resource group validation: {str(e)}")
                         
                         # Add a fallback for all servers for rows beyond our dynamic ones
                         try:
@@ -769,14 +771,7 @@ def update_intersight_data(excel_file):
             print(f"  - Added {len(org_names)} organizations to Organizations sheet")
         else:
             # If no headers found, add them
-            orgs_sheet.cell(row=1, column=1).value = "Organization Name*"
-            orgs_sheet.cell(row=1, column=2).value = "Description"
-            
-            # Style headers
-            for col in range(1, 3):
-                cell = orgs_sheet.cell(row=1, column=col)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')
+            write_header(orgs_sheet, ["Organization Name*", "Description"])
             
             # Add organization data
             for i, org_name in enumerate(org_names):
@@ -803,16 +798,8 @@ def update_intersight_data(excel_file):
                 headers.append(header)
         
         if not headers:
-            # Add headers if they don't exist
-            templates_sheet.cell(row=1, column=1).value = "Template Name*"
-            templates_sheet.cell(row=1, column=2).value = "Description"
-            templates_sheet.cell(row=1, column=3).value = "Organization*"
-            
-            # Style headers
-            for col in range(1, 4):
-                cell = templates_sheet.cell(row=1, column=col)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color='A0D7BE', end_color='A0D7BE', fill_type='solid')
+            # Add styled headers
+            write_header(templates_sheet, ["Template Name*", "Description", "Organization*"])
             
             # Add data validation for organization
             org_validation = DataValidation(type='list', formula1=f'"{",".join(org_names)}"', allow_blank=True)
@@ -912,8 +899,10 @@ def update_intersight_data(excel_file):
         wb.save(temp_file)
         
         # Now verify the saved file can be opened (basic validation check)
+        # A read-only open parses the package and workbook parts without
+        # rebuilding every cell of the file we just wrote
         try:
-            check_wb = openpyxl.load_workbook(temp_file)
+            check_wb = openpyxl.load_workbook(temp_file, read_only=True)
             check_wb.close()
             # If we reached here, file is valid - replace the original
             if os.path.exists(excel_file):